@@ -19,6 +19,23 @@ WINDOW_MIN_HEIGHT = 768
 GALLERY_WIDTH = 300
 TOOLBAR_ICON_SIZE = 24
 STAMP_THUMBNAIL_SIZE = 80
+SIGNATURE_THUMBNAIL_SIZE = (200, 100)  # Width, height of signature pad thumbnails
+
+# Drag and drop
+SIGNATURE_DRAG_METADATA_FORMAT = "<fii"  # struct layout: aspect ratio, original width, original height
+
+# Editing
+UNDO_LIMIT = 100  # Maximum number of undo/redo entries kept in memory
+
+# Storage
+METADATA_FLUSH_DELAY_MS = 250  # Metadata changes within this window share one write
+IMAGE_DATA_CACHE_BYTES = 64 * 1024 * 1024  # Signature/stamp image bytes kept in memory
+PNG_COMPRESS_LEVEL = 1  # zlib level for generated PNGs; small images favour speed over size
+
+# Rendering
+PIXMAP_CACHE_BYTES = 128 * 1024 * 1024  # Memory budget for cached page renders
+PIXMAP_CACHE_MAX_ENTRY_BYTES = 32 * 1024 * 1024  # Larger renders are not cached
+PREFETCH_PAGE_OFFSETS = (-1, 1, 2)  # Pages rendered ahead of time around the current one
 
 # Default categories
 DEFAULT_STAMP_CATEGORIES = ["General", "Signatures", "Custom"]
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 UI styling constants and color definitions for PySign
 """
+import sys
 from PyQt6.QtGui import QColor
 from PyQt6.QtCore import Qt
 
@@ -12,10 +13,14 @@ SUCCESS_COLOR = "#4CAF50"  # Green - Confirmation messages
 WARNING_COLOR = "#FFC107"  # Amber - Warning messages
 ERROR_COLOR = "#F44336"  # Red - Error messages
 
+# Stylesheets are interned so every widget applying one shares a single string.
+# Every selector is scoped to a named main-window widget: the sheets are applied
+# application-wide, and bare type selectors would restyle dialogs and galleries too.
+
 # Button Styles
-SIGN_BUTTON_STYLE = """
-    QToolButton[class="primary"] {
-        background-color: """ + ACCENT_COLOR + """;
+SIGN_BUTTON_STYLE = sys.intern(f"""
+    QToolBar#mainToolbar QToolButton[class="primary"] {{
+        background-color: {ACCENT_COLOR};
         color: white;
         border: none;
         padding: 8px 16px;
@@ -23,60 +28,68 @@ SIGN_BUTTON_STYLE = """
         font-weight: bold;
         min-width: 80px;
         margin: 0 5px;
-    }
-    QToolButton[class="primary"]:hover {
+    }}
+    QToolBar#mainToolbar QToolButton[class="primary"]:hover {{
         background-color: #E91E63;
         transition: background-color 150ms;
-    }
-    QToolButton[class="primary"]:pressed {
+    }}
+    QToolBar#mainToolbar QToolButton[class="primary"]:pressed {{
         background-color: #C2185B;
-    }
-"""
+    }}
+""")
 
-TOOLBAR_STYLE = """
-    QToolBar {
+TOOLBAR_STYLE = sys.intern("""
+    QToolBar#mainToolbar {
         background-color: white;
         border-bottom: 1px solid #E0E0E0;
         padding: 4px;
     }
-    QToolButton {
+    QToolBar#mainToolbar QToolButton {
         border: none;
         border-radius: 4px;
         padding: 4px;
         margin: 0 2px;
     }
-    QToolButton:hover {
+    QToolBar#mainToolbar QToolButton:hover {
         background-color: #F5F5F5;
     }
-    QToolButton:pressed {
+    QToolBar#mainToolbar QToolButton:pressed {
         background-color: #E0E0E0;
     }
-"""
+""")
 
 # Drop Zone Styles
-DROP_ZONE_STYLE = """
-    QFrame#dragContainer {
+DROP_ZONE_STYLE = sys.intern(f"""
+    QFrame#dragContainer {{
         background-color: #F8F9FA;
         border: 2px dashed #DEE2E6;
         border-radius: 8px;
         padding: 16px;
         margin: 8px;
-    }
-    QFrame#dragContainer[dragActive="true"] {
-        background-color: """ + PRIMARY_COLOR + """15;
-        border-color: """ + PRIMARY_COLOR + """;
-    }
-"""
+    }}
+    QFrame#dragContainer[dragActive="true"] {{
+        background-color: {PRIMARY_COLOR}15;
+        border-color: {PRIMARY_COLOR};
+    }}
+""")
 
 # Status Bar Style
-STATUS_BAR_STYLE = """
-    QStatusBar {
+STATUS_BAR_STYLE = sys.intern(f"""
+    QStatusBar#mainStatusBar {{
         background-color: #F8F9FA;
         border-top: 1px solid #DEE2E6;
         padding: 4px;
-        color: """ + SECONDARY_COLOR + """;
-    }
-"""
+        color: {SECONDARY_COLOR};
+    }}
+""")
+
+# Application-wide stylesheet, applied once at startup so Qt parses it a single time
+APP_STYLESHEET = sys.intern("\n".join([
+    TOOLBAR_STYLE,
+    SIGN_BUTTON_STYLE,
+    DROP_ZONE_STYLE,
+    STATUS_BAR_STYLE
+]))
 
 # Animation Durations (in milliseconds)
 HOVER_ANIMATION_DURATION = 150
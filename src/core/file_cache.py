@@ -0,0 +1,74 @@
+"""In-memory cache of small files read repeatedly, such as signature and stamp images"""
+
+import mmap
+import os
+from collections import OrderedDict
+from typing import Tuple
+
+# Skip atime updates where the platform supports it (Linux); O_BINARY matters on Windows
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | _O_NOATIME
+# Files at least this large are copied out of a read-only mapping in one go
+_MMAP_MIN_BYTES = 8 * 1024
+
+def _read_file(path: str, size: int) -> bytes:
+    """Read a file whose size is already known from a stat, without a buffered file object"""
+    try:
+        fd = os.open(path, _READ_FLAGS)
+    except PermissionError:
+        # O_NOATIME is only allowed on files we own
+        fd = os.open(path, _READ_FLAGS & ~_O_NOATIME)
+    try:
+        if size >= _MMAP_MIN_BYTES:
+            try:
+                with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+                    return mapped[:]
+            except (OSError, ValueError):
+                pass  # File shrank since the stat or cannot be mapped; read it instead
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+class FileBytesCache:
+    """LRU cache of file contents, validated against the file's mtime and size"""
+    
+    def __init__(self, max_bytes: int):
+        """Initialize the cache
+        
+        Args:
+            max_bytes: Maximum total size of cached file contents
+        """
+        self._entries: OrderedDict[str, Tuple[float, int, bytes]] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+        
+    def read(self, key: str, path: str) -> bytes:
+        """Get the contents of a file, reading it only if it changed since last time"""
+        st = os.stat(path)
+        entry = self._entries.get(key)
+        if entry and entry[0] == st.st_mtime and entry[1] == st.st_size:
+            self._entries.move_to_end(key)
+            return entry[2]
+        
+        data = _read_file(path, st.st_size)
+        
+        self.discard(key)
+        if len(data) <= self._max_bytes:
+            self._entries[key] = (st.st_mtime, st.st_size, data)
+            self._total_bytes += len(data)
+            while self._total_bytes > self._max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+        return data
+        
+    def discard(self, key: str) -> None:
+        """Drop a cached file"""
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._total_bytes -= len(entry[2])
@@ -0,0 +1,19 @@
+"""Identifier generation for stored signatures and stamps"""
+
+import os
+import time
+import uuid
+
+def new_id() -> str:
+    """Create a time-ordered UUID (version 7) so ids sort in creation order"""
+    if hasattr(uuid, 'uuid7'):  # Python 3.14+
+        return str(uuid.uuid7())
+    
+    # 48-bit millisecond timestamp followed by random bits
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), 'big')
+    
+    # Set version (7) and RFC 4122 variant bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return str(uuid.UUID(int=value))
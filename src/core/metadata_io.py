@@ -0,0 +1,32 @@
+"""Helpers for reading and writing the JSON metadata files of the managers"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def dumps(data) -> bytes:
+    """Serialize metadata to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads(raw: bytes):
+    """Parse metadata JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load(path: Path):
+    """Read and parse a metadata file in a single read"""
+    return loads(path.read_bytes())
+
+def write_atomic(path: Path, data) -> None:
+    """Write metadata to a temporary file and swap it in so readers never see a partial file"""
+    tmp_path = path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(dumps(data))
+    os.replace(tmp_path, path)
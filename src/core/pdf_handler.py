@@ -1,9 +1,15 @@
 import fitz
+import hashlib
+import mmap
 import os
-import tempfile
+from collections import OrderedDict, deque
 from typing import Optional, Tuple, List, Dict
 from dataclasses import dataclass
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QMutex, QMutexLocker, pyqtSignal
+from config.constants import (
+    UNDO_LIMIT, PIXMAP_CACHE_BYTES, PIXMAP_CACHE_MAX_ENTRY_BYTES,
+    PREFETCH_PAGE_OFFSETS
+)
 
 @dataclass
 class PageInfo:
@@ -11,12 +17,31 @@ class PageInfo:
     size: Tuple[float, float]
     rotation: int
 
-@dataclass
+@dataclass(slots=True, eq=False)  # compared by identity, never by image bytes
 class Annotation:
     type: str  # 'stamp' or 'signature'
     rect: Tuple[float, float, float, float]
     content: Dict
     page: int
+    id: Optional[int] = None  # assigned by PDFHandler when added
+
+# Annotation content keys holding raw image bytes, stored in the content pool
+BLOB_KEYS = ('image_data', 'signature_data')
+
+class _PrefetchTask(QRunnable):
+    """Renders a page into the handler's pixmap cache in the background"""
+
+    def __init__(self, handler: 'PDFHandler', page_number: int, zoom: float):
+        super().__init__()
+        self.handler = handler
+        self.page_number = page_number
+        self.zoom = zoom
+
+    def run(self):
+        try:
+            self.handler.get_rendered_pixmap(self.page_number, self.zoom)
+        except Exception:
+            pass  # Prefetch is best effort; the page renders on demand instead
 
 class PDFHandler(QObject):
     # Signals
@@ -29,24 +54,69 @@ class PDFHandler(QObject):
     def __init__(self):
         super().__init__()
         self.document: Optional[fitz.Document] = None
+        self.document_path: Optional[str] = None
+        self._mm: Optional[mmap.mmap] = None  # backing store of the open document
+        self.page_count: int = 0  # read without touching the shared document
+        self._page_infos: List[PageInfo] = []  # filled once per open document
         self.current_page: int = 0
         self.zoom_level: float = 1.0
-        self.annotations: List[Annotation] = []
-        self.undo_stack: List[Dict] = []
-        self.redo_stack: List[Dict] = []
+        self._annotations: Dict[int, Annotation] = {}  # id -> annotation, in insertion order
+        self._next_id: int = 0
+        self.undo_stack: deque = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack: deque = deque(maxlen=UNDO_LIMIT)
+        # content hash -> (refcount, image bytes), shared by annotations and history
+        self._content_pool: Dict[str, Tuple[int, bytes]] = {}
+        self._annotation_refs: Dict[int, Dict[str, str]] = {}  # pool keys per annotation id
+        # (page, zoom, rotation) -> rendered page, least recently used first
+        self._pixmap_cache: OrderedDict[Tuple[int, float, int], fitz.Pixmap] = OrderedDict()
+        self._pixmap_cache_bytes: int = 0
+        self._pixmap_cache_generation: int = 0  # bumped on clear; stale renders are dropped
+        # MuPDF documents are not thread-safe: every use of the document goes
+        # through this lock (QMutex is not recursive, so locked methods call the
+        # unlocked _page helper). A long background save holds it, so cache hits
+        # and page info are served without it.
+        self._render_lock = QMutex()
+        self._cache_lock = QMutex()  # guards the pixmap cache only
+        self._prefetch_pool = QThreadPool()
+        self._prefetch_pool.setMaxThreadCount(1)
+
+    @property
+    def annotations(self) -> List[Annotation]:
+        """All annotations in the order they were added"""
+        return list(self._annotations.values())
 
     def open_document(self, path: str) -> bool:
         """Open a PDF document and initialize it"""
         try:
-            self.document = fitz.open(path)
+            # Memory-map the file so MuPDF pages content in on demand
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                document = fitz.open(stream=mm, filetype='pdf')
+                # Sizes never change while the document is open, so read them once
+                page_infos = [
+                    PageInfo(number=i, size=page.rect.width_height, rotation=page.rotation)
+                    for i, page in enumerate(document)
+                ]
+            except Exception:
+                mm.close()
+                raise
+
+            self._prefetch_pool.clear()
+            with QMutexLocker(self._render_lock):
+                self._close_mapped_document()
+                self.document = document
+                self.document_path = path
+                self._mm = mm
+                self._page_infos = page_infos
+                self.page_count = len(page_infos)
             self.current_page = 0
             self.zoom_level = 1.0
-            self.annotations = []
-            self.undo_stack.clear()
-            self.redo_stack.clear()
+            self._reset_annotations()
+            self.clear_pixmap_cache()
             
             self.document_loaded.emit(True)
-            self.page_changed.emit(0, len(self.document))
+            self.page_changed.emit(0, self.page_count)
             return True
         except Exception:
             self.document_loaded.emit(False)
@@ -54,36 +124,117 @@ class PDFHandler(QObject):
 
     def close_document(self):
         """Close the current document"""
-        if self.document:
+        if self.document is not None:
+            self._prefetch_pool.clear()
+            with QMutexLocker(self._render_lock):
+                self._close_mapped_document()
+            self.current_page = 0
+            self._reset_annotations()
+            self.clear_pixmap_cache()
+
+    def _close_mapped_document(self) -> None:
+        """Close the open document and release its memory map"""
+        if self.document is not None:
             self.document.close()
             self.document = None
-            self.current_page = 0
-            self.annotations = []
-            self.undo_stack.clear()
-            self.redo_stack.clear()
+            self.document_path = None
+            self._page_infos = []
+            self.page_count = 0
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _release_file_mapping(self, path: str) -> None:
+        """Move the open document off its memory map before path is overwritten.
+        Truncating a mapped file would fault MuPDF's lazy reads (SIGBUS), and
+        Windows refuses to write a mapped file at all. Caller holds the render lock."""
+        if self._mm is None or not self.document_path:
+            return
+        try:
+            if not os.path.samefile(path, self.document_path):
+                return
+        except OSError:
+            return  # Target does not exist yet, so it cannot be the mapped file
+        document = fitz.open(stream=self._mm[:], filetype='pdf')
+        self.document.close()
+        self.document = document
+        self._mm.close()
+        self._mm = None
 
     def get_page(self, page_number: int) -> Optional[fitz.Page]:
         """Get a specific page from the document"""
-        if self.document and 0 <= page_number < len(self.document):
+        with QMutexLocker(self._render_lock):
+            return self._page(page_number)
+
+    def _page(self, page_number: int) -> Optional[fitz.Page]:
+        """Load a page; the caller holds the render lock"""
+        if self.document is not None and 0 <= page_number < self.page_count:
             return self.document[page_number]
         return None
 
+    def get_rendered_pixmap(self, page_number: int, zoom: float) -> Optional[fitz.Pixmap]:
+        """Get a page rendered at the given zoom, reusing cached renders.
+        Safe to call from the prefetch thread."""
+        page_infos = self._page_infos
+        if not 0 <= page_number < len(page_infos):
+            return None
+
+        key = (page_number, zoom, page_infos[page_number].rotation)
+        with QMutexLocker(self._cache_lock):
+            pix = self._pixmap_cache.get(key)
+            if pix is not None:
+                self._pixmap_cache.move_to_end(key)
+                return pix
+            generation = self._pixmap_cache_generation
+
+        # Only the render itself waits on the document lock
+        with QMutexLocker(self._render_lock):
+            page = self._page(page_number)
+            if not page:
+                return None
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=True)
+
+        # Skip caching huge (e.g. high-zoom / HiDPI) renders so one page can't
+        # flush the whole cache, and renders that raced a cache clear
+        if pix.size <= PIXMAP_CACHE_MAX_ENTRY_BYTES:
+            with QMutexLocker(self._cache_lock):
+                if generation == self._pixmap_cache_generation and key not in self._pixmap_cache:
+                    self._pixmap_cache[key] = pix
+                    self._pixmap_cache_bytes += pix.size
+                    while self._pixmap_cache_bytes > PIXMAP_CACHE_BYTES:
+                        _, evicted = self._pixmap_cache.popitem(last=False)
+                        self._pixmap_cache_bytes -= evicted.size
+        return pix
+
+    def clear_pixmap_cache(self) -> None:
+        """Drop all cached page renders"""
+        with QMutexLocker(self._cache_lock):
+            self._pixmap_cache.clear()
+            self._pixmap_cache_bytes = 0
+            self._pixmap_cache_generation += 1
+
+    def _prefetch_adjacent_pages(self, page_number: int) -> None:
+        """Queue background renders of the pages around page_number"""
+        # Drop requests for pages the user has already moved away from
+        self._prefetch_pool.clear()
+        for offset in PREFETCH_PAGE_OFFSETS:
+            neighbour = page_number + offset
+            if 0 <= neighbour < self.page_count:
+                self._prefetch_pool.start(_PrefetchTask(self, neighbour, self.zoom_level))
+
     def get_page_info(self, page_number: int) -> Optional[PageInfo]:
         """Get information about a specific page"""
-        page = self.get_page(page_number)
-        if page:
-            return PageInfo(
-                number=page_number,
-                size=page.rect.width_height,
-                rotation=page.rotation
-            )
+        page_infos = self._page_infos
+        if 0 <= page_number < len(page_infos):
+            return page_infos[page_number]
         return None
 
     def navigate_to_page(self, page_number: int) -> bool:
         """Navigate to a specific page"""
-        if self.document and 0 <= page_number < len(self.document):
+        if self.document is not None and 0 <= page_number < self.page_count:
             self.current_page = page_number
-            self.page_changed.emit(page_number, len(self.document))
+            self.page_changed.emit(page_number, self.page_count)
+            self._prefetch_adjacent_pages(page_number)
             return True
         return False
 
@@ -97,36 +248,26 @@ class PDFHandler(QObject):
 
     def add_annotation(self, annotation: Annotation) -> bool:
         """Add an annotation to the current page"""
-        if not self.document:
+        if self.document is None:
             return False
 
         try:
-            undo_action = {
-                'type': 'add_annotation',
-                'annotation': annotation
-            }
-            self.undo_stack.append(undo_action)
-            self.redo_stack.clear()
-
-            self.annotations.append(annotation)
-            self.annotation_added.emit(annotation)
+            annotation_id = self._insert_annotation(annotation)
+            self._push_history(self.undo_stack, self._make_action(
+                'add_annotation', annotation, self._annotation_refs[annotation_id]))
+            self._clear_history(self.redo_stack)
             return True
-        except:
+        except Exception:
             return False
 
     def remove_annotation(self, annotation_id: int) -> bool:
         """Remove an annotation by its ID"""
-        if 0 <= annotation_id < len(self.annotations):
-            undo_action = {
-                'type': 'remove_annotation',
-                'annotation': self.annotations[annotation_id],
-                'annotation_id': annotation_id
-            }
-            self.undo_stack.append(undo_action)
-            self.redo_stack.clear()
-
-            self.annotations.pop(annotation_id)
-            self.annotation_removed.emit(annotation_id)
+        if annotation_id in self._annotations:
+            annotation, refs = self._pop_annotation(annotation_id)
+            self._push_history(self.undo_stack, self._make_action(
+                'remove_annotation', annotation, refs))
+            self._release_refs(refs)
+            self._clear_history(self.redo_stack)
             return True
         return False
 
@@ -136,15 +277,11 @@ class PDFHandler(QObject):
             return False
 
         action = self.undo_stack.pop()
-        self.redo_stack.append(action)
-
-        if action['type'] == 'add_annotation':
-            annotation_id = self.annotations.index(action['annotation'])
-            return self.remove_annotation(annotation_id)
-        elif action['type'] == 'remove_annotation':
-            return self.add_annotation(action['annotation'])
-
-        return False
+        inverse = self._apply_action(action, reverse=True)
+        if inverse is None:
+            return False
+        self._push_history(self.redo_stack, inverse)
+        return True
 
     def redo(self) -> bool:
         """Redo the last undone action"""
@@ -152,22 +289,136 @@ class PDFHandler(QObject):
             return False
 
         action = self.redo_stack.pop()
-        self.undo_stack.append(action)
+        inverse = self._apply_action(action, reverse=False)
+        if inverse is None:
+            return False
+        self._push_history(self.undo_stack, inverse)
+        return True
 
-        if action['type'] == 'add_annotation':
-            return self.add_annotation(action['annotation'])
-        elif action['type'] == 'remove_annotation':
-            annotation_id = self.annotations.index(action['annotation'])
-            return self.remove_annotation(annotation_id)
+    def _apply_action(self, action: Dict, reverse: bool) -> Optional[Dict]:
+        """Apply (or revert) a history action and return its counterpart
+        for the opposite stack. The consumed action's content refs are released.
 
-        return False
+        Moves, resizes and color changes edit the live annotation in place and
+        are not history entries of their own. A record that removes a live
+        annotation is therefore stale by design: the counterpart is always built
+        from the live annotation, so those edits survive undo/redo."""
+        try:
+            adding = (action['type'] == 'remove_annotation') == reverse
+            if adding:
+                annotation = self._rehydrate(action)
+                refs = self._annotation_refs[self._insert_annotation(annotation)]
+            else:
+                if action['id'] not in self._annotations:
+                    return None
+                # The live annotation, not the record, carries the current rect/content
+                annotation, refs = self._pop_annotation(action['id'])
+            counterpart = self._make_action(action['type'], annotation, refs)
+            if not adding:
+                self._release_refs(refs)
+            return counterpart
+        finally:
+            self._release_refs(action['refs'])
+
+    def _insert_annotation(self, annotation: Annotation) -> int:
+        """Append an annotation without recording history and return its id.
+        Annotations restored from history keep their original id."""
+        if annotation.id is None or annotation.id in self._annotations:
+            annotation.id = self._next_id
+            self._next_id += 1
+        refs = {}
+        for key in BLOB_KEYS:
+            data = annotation.content.get(key)
+            if isinstance(data, bytes):
+                # Swap in the pooled copy so identical images share one buffer
+                refs[key] = self._acquire_content(data)
+                annotation.content[key] = self._content_pool[refs[key]][1]
+        self._annotations[annotation.id] = annotation
+        self._annotation_refs[annotation.id] = refs
+        self.annotation_added.emit(annotation)
+        return annotation.id
+
+    def _pop_annotation(self, annotation_id: int) -> Tuple[Annotation, Dict[str, str]]:
+        """Remove an annotation without recording history.
+        The caller is responsible for releasing the returned content refs."""
+        annotation = self._annotations.pop(annotation_id)
+        refs = self._annotation_refs.pop(annotation_id)
+        self.annotation_removed.emit(annotation_id)
+        return annotation, refs
+
+    def _make_action(self, action_type: str, annotation: Annotation,
+                     refs: Dict[str, str]) -> Dict:
+        """Build a lightweight history record referencing pooled image bytes"""
+        content = {k: v for k, v in annotation.content.items() if k not in BLOB_KEYS}
+        for key in refs.values():
+            count, data = self._content_pool[key]
+            self._content_pool[key] = (count + 1, data)
+        return {
+            'type': action_type,
+            'id': annotation.id,
+            'annotation_type': annotation.type,
+            'rect': tuple(annotation.rect),
+            'page': annotation.page,
+            'content': content,
+            'refs': dict(refs)
+        }
+
+    def _rehydrate(self, action: Dict) -> Annotation:
+        """Rebuild an Annotation from a history record"""
+        content = dict(action['content'])
+        for key, ref in action['refs'].items():
+            content[key] = self._content_pool[ref][1]
+        return Annotation(
+            type=action['annotation_type'],
+            rect=action['rect'],
+            content=content,
+            page=action['page'],
+            id=action['id']
+        )
+
+    def _acquire_content(self, data: bytes) -> str:
+        """Add a reference to image bytes in the content pool and return its key"""
+        key = hashlib.blake2b(data, digest_size=16).hexdigest()
+        count, pooled = self._content_pool.get(key, (0, data))
+        self._content_pool[key] = (count + 1, pooled)
+        return key
+
+    def _release_refs(self, refs: Dict[str, str]) -> None:
+        """Drop references to pooled image bytes, freeing unused entries"""
+        for key in refs.values():
+            count, data = self._content_pool.get(key, (0, b''))
+            if count <= 1:
+                self._content_pool.pop(key, None)
+            else:
+                self._content_pool[key] = (count - 1, data)
+
+    def _push_history(self, stack: deque, action: Dict) -> None:
+        """Push an action, releasing the oldest one if the stack is full"""
+        if stack.maxlen is not None and len(stack) == stack.maxlen:
+            self._release_refs(stack[0]['refs'])
+        stack.append(action)
+
+    def _clear_history(self, stack: deque) -> None:
+        """Clear a history stack and release its content refs"""
+        for action in stack:
+            self._release_refs(action['refs'])
+        stack.clear()
+
+    def _reset_annotations(self) -> None:
+        """Drop all annotations, history and pooled content"""
+        self._annotations.clear()
+        self._annotation_refs.clear()
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self._content_pool.clear()
 
     def get_signed_path(self) -> Optional[str]:
         """Get the path where the signed document would be saved"""
-        if not self.document:
+        if self.document is None:
             return None
             
-        original_path = self.document.name
+        # Documents opened from a memory map have no name; use the source path
+        original_path = self.document_path or self.document.name
         base, ext = os.path.splitext(original_path)
         
         # Ensure we're using .pdf extension
@@ -176,72 +427,90 @@ class PDFHandler(QObject):
             
         return f"{base}_signed{ext}"
 
-    def save_document(self, path: Optional[str] = None) -> bool:
-        """Save the document with all annotations"""
-        if not self.document:
+    @staticmethod
+    def _get_image_data(annotation: Annotation) -> Optional[bytes]:
+        """Get the image bytes of a stamp or signature annotation"""
+        for key in BLOB_KEYS:
+            data = annotation.content.get(key)
+            if isinstance(data, bytes):
+                return data
+        return None
+
+    def annotation_placements(self) -> List[Tuple[int, Tuple[float, float, float, float], bytes]]:
+        """Snapshot the page, rect and image bytes of every stamp and signature.
+        Taken on the GUI thread so a background save is unaffected by later edits."""
+        placements = []
+        for annotation in self.annotations:
+            if annotation.type not in ('stamp', 'signature'):
+                continue
+            image_data = self._get_image_data(annotation)
+            if image_data:
+                placements.append((annotation.page, tuple(annotation.rect), image_data))
+        return placements
+
+    def save_document(self, path: Optional[str] = None,
+                      placements: Optional[List[Tuple[int, Tuple[float, float, float, float], bytes]]] = None) -> bool:
+        """Save the document with all annotations (safe to call from a worker thread
+        when given a placements snapshot from annotation_placements)"""
+        if self.document is None:
             return False
+        if placements is None:
+            placements = self.annotation_placements()
 
         try:
-            # If no path provided, use automatic naming
-            if path is None:
-                path = self.get_signed_path()
-                if not path:
+            # MuPDF shares one context between documents, so the whole save runs
+            # under the render lock rather than alongside prefetch or GUI renders
+            with QMutexLocker(self._render_lock):
+                if self.document is None:
                     return False
 
-            # Create a copy of the document for saving
-            doc_copy = fitz.open()
-            doc_copy.insert_pdf(self.document)
-
-            # Apply all annotations
-            for annotation in self.annotations:
-                page = doc_copy[annotation.page]
-                if annotation.type == 'stamp':
-                    # Add stamp annotation
-                    rect = fitz.Rect(*annotation.rect)
-                    tmp = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-                    try:
-                        tmp.write(annotation.content['image_data'])
-                        tmp.flush()
-                        tmp.close()
-                        page.insert_image(rect, filename=tmp.name)
-                    finally:
-                        if os.path.exists(tmp.name):
-                            os.unlink(tmp.name)
-                elif annotation.type == 'signature':
-                    # Add signature annotation
-                    rect = fitz.Rect(*annotation.rect)
-                    tmp = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
+                # If no path provided, use automatic naming
+                if path is None:
+                    path = self.get_signed_path()
+                    if not path:
+                        return False
+
+                # Create a copy of the document for saving
+                doc_copy = fitz.open()
+                doc_copy.insert_pdf(self.document)
+
+                # Apply all annotations, embedding each distinct image only once
+                # and reusing its XObject for every further placement.
+                # Identical images share one pooled bytes object, and the snapshot
+                # keeps them alive, so id() is a valid key for the duration of the save.
+                xrefs: Dict[int, int] = {}
+                for page_number, rect, image_data in placements:
+                    page = doc_copy[page_number]
+                    rect = fitz.Rect(*rect)
+                    xref = xrefs.get(id(image_data))
+                    if xref is None:
+                        xrefs[id(image_data)] = page.insert_image(rect, stream=image_data)
+                    else:
+                        page.insert_image(rect, xref=xref)
+
+                # Ensure path has .pdf extension
+                base, ext = os.path.splitext(path)
+                if not ext.lower() == '.pdf':
+                    path = base + '.pdf'
+
+                # Save and verify the document
+                self._release_file_mapping(path)
+                doc_copy.save(path, garbage=3, deflate=True, clean=True)
+                doc_copy.close()
+
+                # Verify the saved file
+                if os.path.exists(path):
                     try:
-                        tmp.write(annotation.content['signature_data'])
-                        tmp.flush()
-                        tmp.close()
-                        page.insert_image(rect, filename=tmp.name)
-                    finally:
-                        if os.path.exists(tmp.name):
-                            os.unlink(tmp.name)
-
-            # Ensure path has .pdf extension
-            base, ext = os.path.splitext(path)
-            if not ext.lower() == '.pdf':
-                path = base + '.pdf'
-
-            # Save and verify the document
-            doc_copy.save(path, garbage=3, deflate=True, clean=True)
-            doc_copy.close()
-
-            # Verify the saved file
-            if os.path.exists(path):
-                try:
-                    test_doc = fitz.open(path)
-                    if test_doc.is_pdf:
+                        test_doc = fitz.open(path)
+                        if test_doc.is_pdf:
+                            test_doc.close()
+                            return True
                         test_doc.close()
-                        return True
-                    test_doc.close()
-                    os.remove(path)
-                except:
-                    if os.path.exists(path):
                         os.remove(path)
-                    return False
-            return False
+                    except:
+                        if os.path.exists(path):
+                            os.remove(path)
+                        return False
+                return False
         except:
             return False
\ No newline at end of file
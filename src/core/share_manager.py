@@ -1,100 +1,171 @@
+import pythoncom
 import win32com.client
+import logging
 import os
 import subprocess
 import requests
-from typing import Optional
-from PyQt6.QtWidgets import QMessageBox
+from requests_toolbelt import MultipartEncoder
+from PyQt6.QtWidgets import QMessageBox, QApplication
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from urllib.parse import quote
 
-class ShareManager:
-    """Manages sharing functionality including email and WhatsApp integration"""
+logger = logging.getLogger(__name__)
+
+# Uploads above this size get a heads-up before they start
+LARGE_UPLOAD_BYTES = 20 * 1024 * 1024
+
+class _ShareSignals(QObject):
+    """Signals emitted by a share task"""
+    finished = pyqtSignal(object)  # result, or the exception raised
+
+class _ShareTask(QRunnable):
+    """Runs a blocking share step (network upload, COM automation) on the thread pool"""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _ShareSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            result = e
+        self.signals.finished.emit(result)
+
+class ShareManager(QObject):
+    """Manages sharing functionality including email and WhatsApp integration.
+    
+    Slow work runs on a dedicated single-thread pool; results are handled back on
+    the GUI thread, so the share methods return as soon as the work is queued."""
     
     def __init__(self):
-        self._outlook = None
+        super().__init__()
+        # One worker: share tasks never starve the global pool (thumbnails, signed
+        # saves), and the session, which is not thread-safe, is used by one thread
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._session = requests.Session()  # Reuses connections across uploads
     
-    def _get_outlook(self) -> Optional[object]:
-        """Get or create Outlook application instance"""
-        if self._outlook is None:
-            try:
-                self._outlook = win32com.client.Dispatch('Outlook.Application')
-            except Exception as e:
-                print(f"Error connecting to Outlook: {e}")
-                return None
-        return self._outlook
+    def _start(self, task: _ShareTask, on_finished) -> None:
+        """Queue a share task and route its result to a GUI-thread slot"""
+        task.signals.finished.connect(on_finished, Qt.ConnectionType.QueuedConnection)
+        self._pool.start(task)
     
     def share_via_email(self, file_path: str, subject: str = "", body: str = "") -> bool:
-        """Share file via Outlook email"""
+        """Share file via Outlook email. Returns False only if the file can't be
+        accessed; Outlook errors are reported once the background task finishes."""
+        # Resolve once; a single stat doubles as the existence check
+        file_path = os.path.abspath(file_path)
         try:
-            outlook = self._get_outlook()
-            if not outlook:
-                print("Outlook not available")
-                return False
+            os.stat(file_path)
+        except OSError as e:  # missing, permission denied, unreachable drive...
+            logger.error("Cannot access file %s: %s", file_path, e)
+            return False
+        
+        self._start(_ShareTask(self._create_email, file_path, subject, body),
+                    self._on_email_finished)
+        return True
+    
+    @staticmethod
+    def _create_email(file_path: str, subject: str, body: str) -> None:
+        """Create and display an Outlook email (runs on a worker thread)"""
+        # COM objects belong to the apartment that created them, so each
+        # worker initializes COM and dispatches its own Outlook instance
+        pythoncom.CoInitialize()
+        try:
+            outlook = win32com.client.Dispatch('Outlook.Application')
             
-            if not os.path.exists(file_path):
-                print(f"File not found: {file_path}")
-                return False
+            # Create new email
+            mail = outlook.CreateItem(0)  # 0 = olMailItem
             
-            try:
-                # Create new email
-                mail = outlook.CreateItem(0)  # 0 = olMailItem
-                
-                # Set email properties
-                mail.Subject = subject or ""
-                mail.Body = body or ""
-                
-                # Add attachment
-                mail.Attachments.Add(os.path.abspath(file_path))
-                
-                # Display the email
-                mail.Display(True)
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "dialog box is open" in error_msg or "תיבת הדו-שיח פתוחה" in error_msg:
-                    QMessageBox.warning(
-                        None,
-                        "Warning",
-                        "Please close any open Outlook windows and try again.\n"
-                        "נא לסגור את כל החלונות הפתוחים של Outlook ולנסות שוב."
-                    )
-                else:
-                    raise  # Re-raise other exceptions
+            # Set email properties
+            mail.Subject = subject or ""
+            mail.Body = body or ""
             
-            return True
+            # Add attachment
+            mail.Attachments.Add(file_path)
             
-        except Exception as e:
-            print(f"Error creating email: {e}")
-            return False
+            # Display the email without waiting for it to close, so the
+            # share worker is free for the next task
+            mail.Display(False)
+        finally:
+            pythoncom.CoUninitialize()
+    
+    @pyqtSlot(object)
+    def _on_email_finished(self, result) -> None:
+        """Report the outcome of an email share"""
+        if not isinstance(result, Exception):
+            return
+        
+        error_msg = str(result).lower()
+        if "dialog box is open" in error_msg or "תיבת הדו-שיח פתוחה" in error_msg:
+            QMessageBox.warning(
+                None,
+                "Warning",
+                "Please close any open Outlook windows and try again.\n"
+                "נא לסגור את כל החלונות הפתוחים של Outlook ולנסות שוב."
+            )
+        else:
+            logger.error("Error creating email: %s", result, exc_info=result)
+            QMessageBox.critical(
+                None,
+                "Error",
+                "Failed to create email. Please check if Outlook is installed and running."
+            )
     
     def share_via_whatsapp(self, file_path: str) -> bool:
-        """Share file via WhatsApp Desktop app"""
+        """Share file via WhatsApp Desktop app. Returns False only if the file can't
+        be accessed; upload errors are reported once the background task finishes."""
         try:
-            if not os.path.exists(file_path):
-                print(f"File not found: {file_path}")
-                return False
-            
-            # Show upload progress
+            file_size = os.stat(file_path).st_size
+        except OSError as e:  # missing, permission denied, unreachable drive...
+            logger.error("Cannot access file %s: %s", file_path, e)
+            return False
+        
+        # Only interrupt the user for uploads that will take noticeable time
+        if file_size > LARGE_UPLOAD_BYTES:
             QMessageBox.information(
                 None,
                 "Share via WhatsApp",
-                "Please wait..."
+                f"Uploading {file_size / (1024 * 1024):.1f} MB, this may take a while."
             )
-            
-            # Upload file to 0x0.st
-            with open(file_path, 'rb') as f:
-                response = requests.post(
-                    'https://0x0.st',
-                    files={'file': f},
-                    timeout=30  # 30 second timeout
-                )
-            
-            if response.status_code != 200:
-                raise Exception(f"Upload failed with status {response.status_code}")
-            
-            # Get download link
-            download_link = response.text.strip()
+        
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        self._start(_ShareTask(self._upload, file_path), self._on_upload_finished)
+        return True
+    
+    def _upload(self, file_path: str) -> str:
+        """Upload file to 0x0.st and return the download link (runs on a worker thread)"""
+        # Stream the body from disk
+        with open(file_path, 'rb') as f:
+            encoder = MultipartEncoder(
+                fields={'file': (os.path.basename(file_path), f, 'application/pdf')}
+            )
+            with self._session.post(
+                'https://0x0.st',
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+                timeout=30,  # 30 second timeout
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise Exception(f"Upload failed with status {response.status_code}")
+                
+                # Get download link
+                return response.text.strip()
+    
+    @pyqtSlot(object)
+    def _on_upload_finished(self, result) -> None:
+        """Open WhatsApp with the uploaded file's link"""
+        QApplication.restoreOverrideCursor()
+        try:
+            if isinstance(result, Exception):
+                raise result
             
             # Create WhatsApp message with just the link
-            message = download_link
+            message = result
             
             # Open WhatsApp with the message
             whatsapp_url = f"whatsapp://send?text={quote(message)}"
@@ -108,30 +179,24 @@ class ShareManager:
                 "2. Select your contact\n"
                 "3. The download link will be shared"
             )
-            
-            return True
-            
         except requests.Timeout:
-            print("[DEBUG] Upload timed out")
+            logger.warning("Upload timed out")
             QMessageBox.critical(
                 None,
                 "Error",
                 "File upload timed out. Please try again or use a smaller file."
             )
-            return False
         except subprocess.CalledProcessError as e:
-            print(f"[DEBUG] Failed to open WhatsApp: {e}")
+            logger.error("Failed to open WhatsApp: %s", e)
             QMessageBox.critical(
                 None,
                 "Error",
                 "Failed to open WhatsApp. Please make sure WhatsApp Desktop is installed."
             )
-            return False
         except Exception as e:
-            print(f"[DEBUG] Error sharing via WhatsApp: {e}")
+            logger.exception("Error sharing via WhatsApp: %s", e)
             QMessageBox.critical(
                 None,
                 "Error",
                 f"Failed to share file: {str(e)}"
             )
-            return False
\ No newline at end of file
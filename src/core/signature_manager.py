@@ -1,25 +1,57 @@
 import os
+import hashlib
+import threading
+from collections import Counter
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
-import json
-from PyQt6.QtCore import QObject, pyqtSignal
+from contextlib import contextmanager
+from functools import cached_property
+from PyQt6.QtCore import QObject, QTimer, QCoreApplication, pyqtSignal
 from io import BytesIO
-import uuid
+
+from config.constants import (
+    METADATA_FLUSH_DELAY_MS, IMAGE_DATA_CACHE_BYTES, PNG_COMPRESS_LEVEL,
+    SIGNATURE_THUMBNAIL_SIZE
+)
+from core import metadata_io
+from core.file_cache import FileBytesCache
+from core.ids import new_id
+
+PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
 
 class SignatureManager(QObject):
     # Signals
     signature_added = pyqtSignal(str)  # signature_id
     signature_removed = pyqtSignal(str)  # signature_id
     signature_renamed = pyqtSignal(str, str)  # signature_id, new_name
+    changed = pyqtSignal()  # once per metadata flush, after any number of changes
 
     def __init__(self, storage_path: str):
         super().__init__()
         self.storage_path = Path(storage_path)
         self.signatures_dir = self.storage_path / "signatures"
+        self.thumbnails_dir = self.storage_path / ".thumb_cache"
         self.metadata_file = self.storage_path / "signatures_metadata.json"
         self.signatures: Dict[str, Dict] = {}
+        self._all_cache: Optional[List[Dict]] = None  # get_all_signatures result
+        self._file_refs: Counter = Counter()  # image file -> number of signatures using it
+        
+        # Date stamp PNG output is reused between calls
+        self._date_stamp_cache: Dict[str, bytes] = {}  # date string -> PNG bytes
+        self._data_cache = FileBytesCache(IMAGE_DATA_CACHE_BYTES)
+        
+        # Metadata writes are coalesced; see _save_metadata
+        self._dirty = False
+        self._batch_depth = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(METADATA_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush_metadata)
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.flush_metadata)
         
         # Initialize storage
         self._init_storage()
@@ -28,45 +60,92 @@ class SignatureManager(QObject):
         """Initialize signature storage"""
         # Create directories if they don't exist
         self.signatures_dir.mkdir(parents=True, exist_ok=True)
+        self.thumbnails_dir.mkdir(parents=True, exist_ok=True)
         
         # Load or create metadata
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    self.signatures = json.load(f)
+                self.signatures = metadata_io.load(self.metadata_file)
             except Exception as e:
                 print(f"Error loading signatures metadata: {e}")
                 self.signatures = {}
         else:
             self.signatures = {}
+        
+        # Keep each id in its info dict so listings need no copies
+        for signature_id, info in self.signatures.items():
+            info['id'] = signature_id
+            self._file_refs[info['file']] += 1
+
+    @cached_property
+    def _date_template(self) -> Image.Image:
+        """Transparent date stamp background, created on first use"""
+        return Image.new('RGBA', (200, 50), (255, 255, 255, 0))
+
+    @cached_property
+    def _date_font(self):
+        """Date stamp font, loaded on first use"""
+        return ImageFont.load_default()
+
+    @contextmanager
+    def batch(self):
+        """Group several changes into a single metadata write"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.flush_metadata()
 
     def _save_metadata(self):
-        """Save signatures metadata"""
+        """Schedule a metadata write, coalescing bursts of changes"""
+        self._dirty = True
+        self._all_cache = None
+        if self._batch_depth == 0 and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_metadata(self):
+        """Write pending metadata changes to disk"""
+        self._flush_timer.stop()
+        if not self._dirty:
+            return
+        self._dirty = False
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.signatures, f, indent=2)
+            metadata_io.write_atomic(self.metadata_file, self.signatures)
         except Exception as e:
             print(f"Error saving signatures metadata: {e}")
+        self.changed.emit()
 
     def save_signature(self, image_data: bytes, name: str) -> Optional[str]:
         """Save a new signature"""
         try:
             # Generate unique ID
-            signature_id = str(uuid.uuid4())
+            signature_id = new_id()
             
-            # Save signature image
-            signature_path = self.signatures_dir / f"{signature_id}.png"
+            # PNG data (e.g. from the signature canvas) is stored as-is;
+            # other formats are converted with PIL
+            if image_data[:8] != PNG_MAGIC:
+                png_bytes = BytesIO()
+                with Image.open(BytesIO(image_data)) as img:
+                    img.save(png_bytes, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
+                image_data = png_bytes.getvalue()
             
-            # Convert bytes to PIL Image and save
-            with Image.open(BytesIO(image_data)) as img:
-                img.save(signature_path, 'PNG')
+            # Images are stored by content hash, so identical signatures share a file
+            digest = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+            signature_path = self.signatures_dir / f"{digest}.png"
+            if not signature_path.exists():
+                signature_path.write_bytes(image_data)
             
             # Update metadata
             self.signatures[signature_id] = {
+                'id': signature_id,
                 'name': name,
                 'file': str(signature_path),
+                'hash': digest,
                 'created': datetime.now().isoformat()
             }
+            self._file_refs[str(signature_path)] += 1
             
             # Save metadata
             self._save_metadata()
@@ -88,13 +167,18 @@ class SignatureManager(QObject):
             # Get signature info
             signature_info = self.signatures[signature_id]
             
-            # Remove signature file
-            signature_path = Path(signature_info['file'])
-            if signature_path.exists():
-                signature_path.unlink()
+            # Remove signature file once no other signature shares it
+            self._file_refs[signature_info['file']] -= 1
+            if self._file_refs[signature_info['file']] <= 0:
+                del self._file_refs[signature_info['file']]
+                signature_path = Path(signature_info['file'])
+                if signature_path.exists():
+                    signature_path.unlink()
+                self._thumbnail_path(signature_path).unlink(missing_ok=True)
             
             # Update metadata
             del self.signatures[signature_id]
+            self._data_cache.discard(signature_id)
             
             # Save metadata
             self._save_metadata()
@@ -134,20 +218,55 @@ class SignatureManager(QObject):
 
         try:
             signature_info = self.signatures[signature_id]
-            with open(signature_info['file'], 'rb') as f:
-                return f.read(), signature_info['name']
+            return self._data_cache.read(signature_id, signature_info['file']), signature_info['name']
         except Exception as e:
             print(f"Error reading signature data: {e}")
             return None
 
+    def _thumbnail_path(self, signature_path: Path) -> Path:
+        """Location of the cached thumbnail for a signature image file"""
+        width, height = SIGNATURE_THUMBNAIL_SIZE
+        return self.thumbnails_dir / f"{signature_path.stem}_{width}x{height}.png"
+
+    def load_thumbnail(self, signature_file: str) -> bytes:
+        """Get a signature image scaled to thumbnail size as PNG bytes
+        
+        Thumbnails are cached on disk and rebuilt when the image is newer than
+        the cached copy. Only touches the filesystem, so it can run on a
+        worker thread.
+        """
+        signature_path = Path(signature_file)
+        thumb_path = self._thumbnail_path(signature_path)
+        try:
+            if thumb_path.stat().st_mtime >= signature_path.stat().st_mtime:
+                return thumb_path.read_bytes()
+        except FileNotFoundError:
+            pass
+        
+        # Scale to fit the thumbnail box, keeping the aspect ratio
+        width, height = SIGNATURE_THUMBNAIL_SIZE
+        with Image.open(signature_path) as img:
+            scale = min(width / img.width, height / img.height)
+            size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+            thumb = img.convert('RGBA').resize(size, Image.Resampling.LANCZOS)
+        thumb_bytes = BytesIO()
+        thumb.save(thumb_bytes, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
+        data = thumb_bytes.getvalue()
+        
+        # Write through a per-thread temp file so concurrent loads never see a partial file
+        try:
+            tmp_path = thumb_path.with_suffix(f'.{threading.get_ident()}.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, thumb_path)
+        except OSError as e:
+            print(f"Error caching signature thumbnail: {e}")
+        return data
+
     def get_all_signatures(self) -> List[Dict]:
-        """Get all signatures"""
-        signatures = []
-        for signature_id, info in self.signatures.items():
-            signature_info = info.copy()
-            signature_info['id'] = signature_id
-            signatures.append(signature_info)
-        return signatures
+        """Get all signatures (shared, read-only list rebuilt only after changes)"""
+        if self._all_cache is None:
+            self._all_cache = list(self.signatures.values())
+        return self._all_cache
 
     def create_date_stamp(self, date: datetime = None) -> bytes:
         """Create a date stamp image"""
@@ -155,18 +274,22 @@ class SignatureManager(QObject):
             if date is None:
                 date = datetime.now()
             
-            # Create image with transparent background
-            img = Image.new('RGBA', (200, 50), (255, 255, 255, 0))
-            draw = ImageDraw.Draw(img)
-            
-            # Add date text
+            # Stamps for the same day are identical
             date_str = date.strftime("%Y-%m-%d")
-            draw.text((10, 10), date_str, fill=(0, 0, 0, 255))
+            cached = self._date_stamp_cache.get(date_str)
+            if cached is not None:
+                return cached
+            
+            # Copy the transparent template and add date text
+            img = self._date_template.copy()
+            draw = ImageDraw.Draw(img)
+            draw.text((10, 10), date_str, font=self._date_font, fill=(0, 0, 0, 255))
             
             # Convert to bytes
             img_bytes = BytesIO()
-            img.save(img_bytes, format='PNG')
-            return img_bytes.getvalue()
+            img.save(img_bytes, format='PNG', compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+            self._date_stamp_cache[date_str] = img_bytes.getvalue()
+            return self._date_stamp_cache[date_str]
         except Exception as e:
             print(f"Error creating date stamp: {e}")
             return None
@@ -174,8 +297,7 @@ class SignatureManager(QObject):
     def import_signature(self, path: str, name: str) -> Optional[str]:
         """Import a signature from an image file"""
         try:
-            with open(path, 'rb') as f:
-                image_data = f.read()
+            image_data = Path(path).read_bytes()
             return self.save_signature(image_data, name)
         except Exception as e:
             print(f"Error importing signature: {e}")
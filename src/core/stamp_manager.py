@@ -1,11 +1,15 @@
 import os
-import json
 import shutil
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from PIL import Image
-from PyQt6.QtCore import QObject, pyqtSignal
-import uuid
+from PyQt6.QtCore import QObject, QTimer, QCoreApplication, pyqtSignal
+
+from config.constants import METADATA_FLUSH_DELAY_MS, IMAGE_DATA_CACHE_BYTES, PNG_COMPRESS_LEVEL
+from core import metadata_io
+from core.file_cache import FileBytesCache
+from core.ids import new_id
 
 class StampManager(QObject):
     # Signals
@@ -15,6 +19,7 @@ class StampManager(QObject):
     stamp_color_changed = pyqtSignal(str, str)  # stamp_id, new_color
     category_added = pyqtSignal(str)  # category
     category_removed = pyqtSignal(str)  # category
+    changed = pyqtSignal()  # once per metadata flush, after any number of changes
 
     def __init__(self, storage_path: str):
         super().__init__()
@@ -23,6 +28,19 @@ class StampManager(QObject):
         self.metadata_file = self.storage_path / "stamps_metadata.json"
         self.stamps: Dict[str, Dict] = {}  # stamp_id -> stamp_info
         self.categories: Dict[str, List[str]] = {}  # category -> [stamp_ids]
+        self._by_cat_cache: Dict[str, List[Dict]] = {}  # get_stamps_by_category results
+        self._data_cache = FileBytesCache(IMAGE_DATA_CACHE_BYTES)
+        
+        # Metadata writes are coalesced; see _save_metadata
+        self._dirty = False
+        self._batch_depth = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(METADATA_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush_metadata)
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.flush_metadata)
         
         # Initialize storage
         self._init_storage()
@@ -35,30 +53,55 @@ class StampManager(QObject):
         # Load or create metadata
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    data = json.load(f)
-                    self.stamps = data.get('stamps', {})
-                    self.categories = data.get('categories', {})
+                data = metadata_io.load(self.metadata_file)
+                self.stamps = data.get('stamps', {})
+                self.categories = data.get('categories', {})
             except Exception as e:
                 print(f"Error loading stamps metadata: {e}")
                 self.stamps = {}
                 self.categories = {}
         
+        # Keep each id in its info dict so listings need no copies
+        for stamp_id, info in self.stamps.items():
+            info['id'] = stamp_id
+        
         # Ensure "General" category exists
         if "General" not in self.categories:
             self.categories["General"] = []
             self.category_added.emit("General")
 
+    @contextmanager
+    def batch(self):
+        """Group several changes into a single metadata write"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.flush_metadata()
+
     def _save_metadata(self):
-        """Save stamps metadata to file"""
+        """Schedule a metadata write, coalescing bursts of changes"""
+        self._dirty = True
+        self._by_cat_cache.clear()
+        if self._batch_depth == 0 and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_metadata(self):
+        """Write pending metadata changes to disk"""
+        self._flush_timer.stop()
+        if not self._dirty:
+            return
+        self._dirty = False
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump({
-                    'stamps': self.stamps,
-                    'categories': self.categories
-                }, f, indent=2)
+            metadata_io.write_atomic(self.metadata_file, {
+                'stamps': self.stamps,
+                'categories': self.categories
+            })
         except Exception as e:
             print(f"Error saving stamps metadata: {e}")
+        self.changed.emit()
 
     def import_stamp(self, path: str, name: str, category: str = "General") -> Optional[str]:
         """Import a stamp from an image file"""
@@ -68,7 +111,7 @@ class StampManager(QObject):
                 self.add_category(category)
 
             # Generate unique ID
-            stamp_id = str(uuid.uuid4())
+            stamp_id = new_id()
             
             # Process and save image
             with Image.open(path) as img:
@@ -81,10 +124,11 @@ class StampManager(QObject):
                 
                 # Save processed image
                 stamp_path = self.stamps_dir / f"{stamp_id}.png"
-                img.save(stamp_path, 'PNG')
+                img.save(stamp_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL, optimize=False)
 
             # Update metadata
             self.stamps[stamp_id] = {
+                'id': stamp_id,
                 'name': name,
                 'category': category,
                 'file': str(stamp_path),
@@ -124,6 +168,7 @@ class StampManager(QObject):
             # Update metadata
             self.categories[category].remove(stamp_id)
             del self.stamps[stamp_id]
+            self._data_cache.discard(stamp_id)
             
             # Save changes
             self._save_metadata()
@@ -196,18 +241,19 @@ class StampManager(QObject):
             return False
 
         try:
-            # Move stamps to General category
-            stamps_to_move = self.categories[category].copy()
-            for stamp_id in stamps_to_move:
-                if stamp_id in self.stamps:
-                    self.stamps[stamp_id]['category'] = "General"
-                    self.categories["General"].append(stamp_id)
-            
-            # Remove category
-            del self.categories[category]
-            
-            # Save changes
-            self._save_metadata()
+            with self.batch():
+                # Move stamps to General category
+                stamps_to_move = self.categories[category].copy()
+                for stamp_id in stamps_to_move:
+                    if stamp_id in self.stamps:
+                        self.stamps[stamp_id]['category'] = "General"
+                        self.categories["General"].append(stamp_id)
+                
+                # Remove category
+                del self.categories[category]
+                
+                # Save changes
+                self._save_metadata()
             
             # Emit signal
             self.category_removed.emit(category)
@@ -224,28 +270,26 @@ class StampManager(QObject):
 
         try:
             stamp_info = self.stamps[stamp_id]
-            with open(stamp_info['file'], 'rb') as f:
-                return f.read(), stamp_info['name'], {
-                    'original_width': stamp_info.get('original_width', 100),
-                    'original_height': stamp_info.get('original_height', 100),
-                    'aspect_ratio': stamp_info.get('aspect_ratio', 1.0),
-                    'color': stamp_info.get('color', '#000000')
-                }
+            return self._data_cache.read(stamp_id, stamp_info['file']), stamp_info['name'], {
+                'original_width': stamp_info.get('original_width', 100),
+                'original_height': stamp_info.get('original_height', 100),
+                'aspect_ratio': stamp_info.get('aspect_ratio', 1.0),
+                'color': stamp_info.get('color', '#000000')
+            }
         except Exception as e:
             print(f"Error reading stamp data: {e}")
             return None
 
     def get_stamps_by_category(self, category: str) -> List[Dict]:
-        """Get all stamps in a category"""
+        """Get all stamps in a category (shared, read-only list rebuilt only after changes)"""
         if category not in self.categories:
             return []
 
-        stamps = []
-        for stamp_id in self.categories[category]:
-            if stamp_id in self.stamps:
-                stamp_info = self.stamps[stamp_id].copy()
-                stamp_info['id'] = stamp_id
-                stamps.append(stamp_info)
+        stamps = self._by_cat_cache.get(category)
+        if stamps is None:
+            stamps = [self.stamps[stamp_id] for stamp_id in self.categories[category]
+                      if stamp_id in self.stamps]
+            self._by_cat_cache[category] = stamps
         
         return stamps
 
@@ -1,6 +1,14 @@
 import sys
 from PyQt6.QtWidgets import QApplication
 from ui.main_window import MainWindow
+from config.styles import APP_STYLESHEET
+from config.constants import STAMPS_DIR, SIGNATURES_DIR
+
+def _ensure_dirs():
+    """Create the storage directories once per process; after the first run a stat each suffices"""
+    for storage_dir in (STAMPS_DIR, SIGNATURES_DIR):
+        if not storage_dir.is_dir():
+            storage_dir.mkdir(parents=True, exist_ok=True)
 
 def main():
     app = QApplication(sys.argv)
@@ -10,6 +18,12 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("PySign")
     
+    # Apply the shared stylesheet once for the whole application
+    app.setStyleSheet(APP_STYLESHEET)
+    
+    # Storage directories are process-wide, so they are set up before any window
+    _ensure_dirs()
+    
     # Create and show main window
     window = MainWindow()
     window.show()
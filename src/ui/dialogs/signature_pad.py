@@ -4,33 +4,152 @@ from PyQt6.QtWidgets import (
     QScrollArea, QWidget, QGridLayout, QStyle
 )
 from PyQt6.QtGui import (
-    QPainter, QPen, QColor, QPixmap, QImage,
-    QPainterPath, QMouseEvent, QDrag
+    QPainter, QPen, QColor, QPixmap, QPixmapCache, QImage, QImageReader,
+    QPolygonF, QMouseEvent, QDrag
 )
 from PyQt6.QtCore import (
-    Qt, QPoint, QRect, QSize, QByteArray,
-    QBuffer, QIODevice, QMimeData
+    Qt, QPoint, QRect, QSize, QByteArray, QLine,
+    QBuffer, QIODevice, QMimeData, QTimer,
+    QObject, QRunnable, QThreadPool, QEvent, pyqtSignal
 )
 from datetime import datetime
 from PIL import Image
 from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+import logging
 import os
-import json
+import struct
+import sys
 
 from core.signature_manager import SignatureManager
-from config.constants import SUPPORTED_IMAGE_FORMATS, SIGNATURES_DIR
+from config.constants import (
+    SUPPORTED_IMAGE_FORMATS, SIGNATURES_DIR, SIGNATURE_THUMBNAIL_SIZE,
+    SIGNATURE_DRAG_METADATA_FORMAT
+)
+
+logger = logging.getLogger(__name__)
+
+# Stroke repaints are coalesced to roughly one per display frame
+STROKE_UPDATE_INTERVAL_MS = 16
+# Margin around a stroke segment covering pen width and antialiasing
+STROKE_DIRTY_MARGIN = 3
+# White border kept around the stroke in exported signature images
+SIGNATURE_EXPORT_MARGIN = 4
+
+# The signature canvas has a fixed size, so its grid and baseline are built once
+CANVAS_WIDTH, CANVAS_HEIGHT = 500, 200
+GRID_STEP = 50
+GRID_LINES = tuple(
+    [QLine(x, 0, x, CANVAS_HEIGHT) for x in range(0, CANVAS_WIDTH, GRID_STEP)] +
+    [QLine(0, y, CANVAS_WIDTH, y) for y in range(0, CANVAS_HEIGHT, GRID_STEP)]
+)
+BASELINE = QLine(0, CANVAS_HEIGHT * 2 // 3, CANVAS_WIDTH, CANVAS_HEIGHT * 2 // 3)
+
+# Thumbnail area inside a SignatureThumbnail
+THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT = SIGNATURE_THUMBNAIL_SIZE
+
+# Stylesheets are built once at import and shared by every canvas and dialog
+SIGNATURE_CANVAS_STYLE = sys.intern("""
+    SignatureCanvas {
+        background-color: white;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+    }
+""")
+
+SIGNATURE_PAD_STYLE = sys.intern("""
+    QDialog {
+        background-color: white;
+    }
+    QPushButton {
+        padding: 8px 16px;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        background-color: white;
+        color: #212529;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #f8f9fa;
+        border-color: #c1c9d0;
+    }
+    QPushButton:pressed {
+        background-color: #e9ecef;
+    }
+    QPushButton[class="primary"] {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+    }
+    QPushButton[class="primary"]:hover {
+        background-color: #1976D2;
+    }
+    QPushButton[class="danger"] {
+        background-color: #dc3545;
+        color: white;
+        border: none;
+    }
+    QPushButton[class="danger"]:hover {
+        background-color: #c82333;
+    }
+    QLabel {
+        color: #212529;
+        font-size: 14px;
+    }
+    QLabel[class="title"] {
+        font-size: 16px;
+        font-weight: bold;
+        padding: 8px;
+        margin-bottom: 8px;
+    }
+    QScrollArea {
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        background-color: white;
+    }
+    SignatureThumbnail {
+        background-color: white;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        padding: 8px;
+        margin: 4px;
+    }
+    SignatureThumbnail:hover {
+        border-color: #2196F3;
+        background-color: #f8f9fa;
+    }
+    SignatureThumbnail[selected="true"] {
+        background-color: #e3f2fd;
+        border: 2px solid #2196F3;
+    }
+    SignatureThumbnail QLabel {
+        color: #495057;
+        font-size: 12px;
+        padding-top: 4px;
+        border: none;
+        background-color: transparent;
+    }
+""")
 
 class SignatureCanvas(QWidget):
     def __init__(self):
         super().__init__()
-        self.path = QPainterPath()
-        self.points = []
+        self.points = QPolygonF()  # Current stroke, drawn as a polyline
         self.last_point = None
         self.is_drawing = False
         self.show_guide = True  # Show guide text when empty
+        self._background: Optional[QPixmap] = None  # Static grid and baseline, built on first paint
+        self._stroke_layer: Optional[QPixmap] = None  # Stroke rasterized segment by segment
+        
+        # Area touched by the stroke since the last repaint
+        self._pending_rect = QRect()
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(STROKE_UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._flush_pending_update)
         
         # Set fixed size for canvas
-        self.setFixedSize(500, 200)  # Wider canvas for better usability
+        self.setFixedSize(CANVAS_WIDTH, CANVAS_HEIGHT)  # Wider canvas for better usability
         
         # Set white background with border
         self.setAutoFillBackground(True)
@@ -39,65 +158,126 @@ class SignatureCanvas(QWidget):
         self.setPalette(palette)
         
         # Add border and shadow effect
-        self.setStyleSheet("""
-            SignatureCanvas {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-            }
-        """)
+        self.setStyleSheet(SIGNATURE_CANVAS_STYLE)
 
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press events"""
         if event.button() == Qt.MouseButton.LeftButton:
             self.is_drawing = True
             self.last_point = event.position().toPoint()
-            self.points = [self.last_point]
-            self.path = QPainterPath()
-            self.path.moveTo(event.position())
+            self.points = QPolygonF([event.position()])
+            # Previous stroke and guide text go away, so repaint everything once
+            self._stroke_layer = None
+            self._pending_rect = QRect()
+            self.update()
 
     def mouseMoveEvent(self, event: QMouseEvent):
         """Handle mouse move events"""
         if self.is_drawing:
             new_point = event.position().toPoint()
-            self.path.lineTo(event.position())
-            self.points.append(new_point)
+            previous = self.points.at(self.points.count() - 1)
+            self.points.append(event.position())
+            
+            # Rasterize only the new segment into the stroke layer
+            if self._stroke_layer is not None:
+                painter = QPainter(self._stroke_layer)
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                painter.setPen(self._stroke_pen())
+                painter.drawLine(previous, event.position())
+                painter.end()
+            
+            # Only repaint the area around the new segment
+            margin = STROKE_DIRTY_MARGIN
+            segment = QRect(self.last_point, new_point).normalized().adjusted(
+                -margin, -margin, margin, margin
+            )
+            self._pending_rect = self._pending_rect.united(segment)
+            if not self._update_timer.isActive():
+                self._update_timer.start()
+            
             self.last_point = new_point
-            self.update()
+
+    def _flush_pending_update(self):
+        """Repaint the area touched by the stroke since the last flush"""
+        if not self._pending_rect.isNull():
+            self.update(self._pending_rect)
+            self._pending_rect = QRect()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Handle mouse release events"""
         if event.button() == Qt.MouseButton.LeftButton:
             self.is_drawing = False
+            # Show the end of the stroke without waiting for the timer
+            self._update_timer.stop()
+            self._flush_pending_update()
 
-    def paintEvent(self, event):
-        """Paint the signature with guide text and grid"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def resizeEvent(self, event):
+        """Rebuild the cached layers for the new size"""
+        self._background = None
+        self._stroke_layer = None
+        super().resizeEvent(event)
+
+    @staticmethod
+    def _stroke_pen() -> QPen:
+        """Pen used for signature strokes"""
+        pen = QPen(Qt.GlobalColor.black, 2, Qt.PenStyle.SolidLine)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        return pen
+
+    def _build_stroke_layer(self) -> QPixmap:
+        """Create the transparent stroke layer, drawing the stroke so far"""
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(Qt.GlobalColor.transparent)
+        
+        if not self.points.isEmpty():
+            painter = QPainter(layer)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(self._stroke_pen())
+            painter.drawPolyline(self.points)
+            painter.end()
+        
+        return layer
+
+    def _build_background(self) -> QPixmap:
+        """Render the white background, grid and baseline once"""
+        ratio = self.devicePixelRatioF()
+        background = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        background.setDevicePixelRatio(ratio)
+        background.fill(Qt.GlobalColor.white)
         
-        # Draw background
-        painter.fillRect(event.rect(), Qt.GlobalColor.white)
+        # Axis-aligned integer lines gain nothing from antialiasing
+        painter = QPainter(background)
         
         # Draw subtle grid pattern
         grid_pen = QPen(QColor("#f0f0f0"), 1, Qt.PenStyle.SolidLine)
         painter.setPen(grid_pen)
         
-        # Vertical lines
-        for x in range(0, self.width(), 50):
-            painter.drawLine(x, 0, x, self.height())
-            
-        # Horizontal lines
-        for y in range(0, self.height(), 50):
-            painter.drawLine(0, y, self.width(), y)
+        # Vertical and horizontal lines in a single batched call
+        painter.drawLines(GRID_LINES)
         
         # Draw baseline
         baseline_pen = QPen(QColor("#e0e0e0"), 2, Qt.PenStyle.DashLine)
         painter.setPen(baseline_pen)
-        baseline_y = self.height() * 2 // 3
-        painter.drawLine(0, baseline_y, self.width(), baseline_y)
+        painter.drawLine(BASELINE)
+        painter.end()
+        
+        return background
+
+    def paintEvent(self, event):
+        """Paint the signature with guide text and grid"""
+        if self._background is None:
+            self._background = self._build_background()
+        
+        painter = QPainter(self)
+        
+        # Blit the static background (clipped to the repainted area)
+        painter.drawPixmap(0, 0, self._background)
         
         # Draw guide text if no signature and show_guide is True
-        if not self.points and self.show_guide:
+        if self.points.isEmpty() and self.show_guide:
             painter.setPen(QPen(QColor("#999999")))
             font = painter.font()
             font.setPointSize(12)
@@ -105,124 +285,136 @@ class SignatureCanvas(QWidget):
             text_rect = self.rect()
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, "Sign Here")
         
-        # Draw signature with smooth, variable-width pen
-        if self.points:
-            pen = QPen(Qt.GlobalColor.black, 2, Qt.PenStyle.SolidLine)
-            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(pen)
-            painter.drawPath(self.path)
+        # Draw signature from the stroke layer; new segments were already
+        # rasterized as they arrived, so a repaint is only a clipped blit
+        if not self.points.isEmpty():
+            if self._stroke_layer is None:
+                self._stroke_layer = self._build_stroke_layer()
+            painter.drawPixmap(0, 0, self._stroke_layer)
 
     def clear(self):
         """Clear the signature"""
-        self.path = QPainterPath()
-        self.points = []
+        self.points = QPolygonF()
         self.last_point = None
+        self._stroke_layer = None
+        self._update_timer.stop()
+        self._pending_rect = QRect()
         self.update()
 
     def get_signature_image(self) -> bytes:
-        """Get the signature as a PNG image"""
-        # Create pixmap and fill with white
-        pixmap = QPixmap(self.size())
-        pixmap.fill(Qt.GlobalColor.white)
-        
-        # Draw signature on pixmap
-        painter = QPainter(pixmap)
+        """Get the signature as a PNG image, cropped to the stroke"""
+        # Only the stroke's bounding box (plus a margin) is exported, clipped to the
+        # canvas: the mouse grab keeps adding points when a stroke leaves it
+        bounds = self.rect()
+        if not self.points.isEmpty():
+            margin = SIGNATURE_EXPORT_MARGIN
+            stroke = self.points.boundingRect().adjusted(-margin, -margin, margin, margin)
+            clipped = stroke.toAlignedRect().intersected(self.rect())
+            if not clipped.isEmpty():
+                bounds = clipped
+        
+        # Black ink on white only needs one byte per pixel
+        image = QImage(bounds.size(), QImage.Format.Format_Grayscale8)
+        image.fill(Qt.GlobalColor.white)
+        
+        # Draw signature on image
+        painter = QPainter(image)
+        painter.translate(-bounds.left(), -bounds.top())
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         pen = QPen(Qt.GlobalColor.black, 2, Qt.PenStyle.SolidLine)
         painter.setPen(pen)
-        painter.drawPath(self.path)
+        painter.drawPolyline(self.points)
         painter.end()
         
         # Convert to bytes
         byte_array = QByteArray()
         buffer = QBuffer(byte_array)
         buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(buffer, 'PNG')
+        image.save(buffer, 'PNG')
         buffer.close()
         
         return byte_array.data()
 
 class SignatureThumbnail(QLabel):
-    def __init__(self, signature_id: str, signature_data: bytes, name: str, parent=None):
+    def __init__(self, signature_id: str, name: str, signature_manager: SignatureManager,
+                 parent=None, pixmap: Optional[QPixmap] = None):
         super().__init__(parent)
         self.signature_id = signature_id
-        self.signature_data = signature_data
+        self.signature_manager = signature_manager
         self.signature_name = name
         self.is_selected = False
+        self._original_size: Optional[Tuple[int, int]] = None  # read on first drag
+        self._drag_pixmap: Optional[QPixmap] = None  # built on first drag
+        self._drag_hotspot = QPoint()
         
-        # Create pixmap from signature data
-        image = QImage.fromData(signature_data)
-        pixmap = QPixmap.fromImage(image)
-        
-        # Scale pixmap to thumbnail size
-        scaled_pixmap = pixmap.scaled(
-            200, 100,  # Larger size for better visibility
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        # The thumbnail is loaded separately; show a blank one until it arrives
+        if pixmap is None:
+            pixmap = self.placeholder_pixmap()
         
         # Set pixmap and configure label
-        self.setPixmap(scaled_pixmap)
+        self.setPixmap(pixmap)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setToolTip(f"Name: {name}\nClick to select")
         self.setFixedSize(QSize(220, 140))  # Larger size to accommodate name label
         
-        # Modern styling with hover effect
-        self.setStyleSheet("""
-            SignatureThumbnail {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 8px;
-                margin: 4px;
-            }
-            SignatureThumbnail:hover {
-                border-color: #2196F3;
-                background-color: #f8f9fa;
-            }
-        """)
+        # Styling (including hover and selection) comes from the dialog stylesheet
+        self.setProperty("selected", False)
         
         # Add name label below thumbnail
         self.name_label = QLabel(name, self)
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.name_label.setStyleSheet("""
-            QLabel {
-                color: #495057;
-                font-size: 12px;
-                padding-top: 4px;
-            }
-        """)
         self.name_label.move(0, self.height() - 25)
         self.name_label.setFixedWidth(self.width())
 
+    def setPixmap(self, pixmap: QPixmap):
+        """Set the thumbnail pixmap, dropping the drag pixmap derived from the old one"""
+        self._drag_pixmap = None
+        super().setPixmap(pixmap)
+
+    @property
+    def signature_data(self) -> Optional[bytes]:
+        """Full-resolution signature image, fetched from the manager only when needed"""
+        result = self.signature_manager.get_signature_data(self.signature_id)
+        return result[0] if result else None
+
+    def original_size(self, signature_data: bytes) -> Tuple[int, int]:
+        """Get the original image dimensions, reading only the image header once"""
+        if self._original_size is None:
+            buffer = QBuffer()
+            buffer.setData(QByteArray(signature_data))
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            size = QImageReader(buffer).size()
+            buffer.close()
+            if size.isValid():
+                self._original_size = (size.width(), size.height())
+            else:
+                self._original_size = (100, 100)
+        return self._original_size
+
+    def set_name(self, name: str):
+        """Update the displayed name and tooltip"""
+        if name == self.signature_name:
+            return
+        self.signature_name = name
+        self.name_label.setText(name)
+        self.setToolTip(f"Name: {name}\nClick to select")
+
+    @staticmethod
+    def placeholder_pixmap() -> QPixmap:
+        """Blank thumbnail shown while the real one is decoded"""
+        pixmap = QPixmap(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+        pixmap.fill(QColor("#f1f3f5"))
+        return pixmap
+
     def setSelected(self, selected: bool):
         """Update the selection state and styling"""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
-        if selected:
-            self.setStyleSheet("""
-                SignatureThumbnail {
-                    background-color: #e3f2fd;
-                    border: 2px solid #2196F3;
-                    border-radius: 4px;
-                    padding: 8px;
-                    margin: 4px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                SignatureThumbnail {
-                    background-color: white;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                    margin: 4px;
-                }
-                SignatureThumbnail:hover {
-                    border-color: #2196F3;
-                    background-color: #f8f9fa;
-                }
-            """)
+        # Re-polish so the [selected] rules of the dialog stylesheet apply
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def mousePressEvent(self, event):
         """Handle mouse press for selection and drag start"""
@@ -244,49 +436,81 @@ class SignatureThumbnail(QLabel):
         if (event.pos() - self.drag_start_position).manhattanLength() < 10:
             return
 
+        # The original image is only needed once a drag actually starts
+        signature_data = self.signature_data
+        if not signature_data:
+            return
+
         # Create mime data with signature information
         mime_data = QMimeData()
-        mime_data.setData("application/x-signature", QByteArray(self.signature_data))
+        mime_data.setData("application/x-signature", QByteArray(signature_data))
         mime_data.setText(self.signature_name)
 
-        # Add metadata as JSON - get dimensions from original image data
-        original_img = QImage.fromData(self.signature_data)
-        original_width = original_img.width() if not original_img.isNull() else 100
-        original_height = original_img.height() if not original_img.isNull() else 100
+        # Add metadata as a packed struct - dimensions of the original image
+        original_width, original_height = self.original_size(signature_data)
         aspect_ratio = original_width / original_height if original_height > 0 else 1.0
 
-        metadata = {
-            'type': 'signature',
-            'aspect_ratio': aspect_ratio,
-            'original_width': original_width,
-            'original_height': original_height
-        }
-        metadata_bytes = json.dumps(metadata).encode('utf-8')
+        metadata_bytes = struct.pack(
+            SIGNATURE_DRAG_METADATA_FORMAT, aspect_ratio, original_width, original_height
+        )
         mime_data.setData("application/x-signature-metadata", QByteArray(metadata_bytes))
 
         # Create drag object
         drag = QDrag(self)
         drag.setMimeData(mime_data)
 
-        # Create drag pixmap (scaled for better visibility)
-        pixmap = self.pixmap()
-        if pixmap:
-            scaled_pixmap = pixmap.scaled(
-                64, 64,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            drag.setPixmap(scaled_pixmap)
-            drag.setHotSpot(QPoint(scaled_pixmap.width() // 2, scaled_pixmap.height() // 2))
+        # Create drag pixmap (scaled for better visibility), reused across drags
+        if self._drag_pixmap is None:
+            pixmap = self.pixmap()
+            if pixmap and not pixmap.isNull():
+                self._drag_pixmap = pixmap.scaled(
+                    64, 64,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                self._drag_hotspot = QPoint(self._drag_pixmap.width() // 2, self._drag_pixmap.height() // 2)
+        if self._drag_pixmap is not None:
+            drag.setPixmap(self._drag_pixmap)
+            drag.setHotSpot(self._drag_hotspot)
 
         # Execute drag operation
         drag.exec(Qt.DropAction.CopyAction)
 
+class _ThumbnailSignals(QObject):
+    """Signals emitted by a thumbnail task"""
+    loaded = pyqtSignal(str, object, QImage)  # signature file, file mtime, thumbnail (null on failure)
+
+class _ThumbnailTask(QRunnable):
+    """Loads a signature thumbnail (from the on-disk thumbnail cache when possible) on the thread pool"""
+    
+    def __init__(self, signature_file: str, mtime: Optional[float], signature_manager: SignatureManager):
+        super().__init__()
+        self.signature_file = signature_file
+        self.mtime = mtime
+        self.signature_manager = signature_manager
+        self.signals = _ThumbnailSignals()
+    
+    def run(self):
+        try:
+            image = QImage.fromData(self.signature_manager.load_thumbnail(self.signature_file))
+        except Exception as e:
+            logger.exception("Error loading signature thumbnail: %s", e)
+            image = QImage()
+        self.signals.loaded.emit(self.signature_file, self.mtime, image)
+
 class SignaturePadDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, signature_manager: Optional[SignatureManager] = None):
         super().__init__(parent)
-        self.signature_manager = SignatureManager(str(SIGNATURES_DIR))
+        if signature_manager is None:
+            signature_manager = SignatureManager(str(SIGNATURES_DIR))
+        self.signature_manager = signature_manager
         self.selected_signature = None
+        # signature file -> ids waiting for its thumbnail; one load per file
+        self._pending_thumbs: Dict[str, List[str]] = {}
+        # signature_id -> thumbnail widget currently in the grid
+        self._thumb_widgets: Dict[str, SignatureThumbnail] = {}
+        # Signature list the grid was last built from
+        self._shown_signatures: Optional[List[Dict]] = None
         self.init_ui()
 
     def init_ui(self):
@@ -295,57 +519,7 @@ class SignaturePadDialog(QDialog):
         self.setMinimumWidth(900)  # Wider dialog for better layout
         
         # Apply modern styling to the dialog
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-            QPushButton {
-                padding: 8px 16px;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                background-color: white;
-                color: #212529;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #f8f9fa;
-                border-color: #c1c9d0;
-            }
-            QPushButton:pressed {
-                background-color: #e9ecef;
-            }
-            QPushButton[class="primary"] {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-            }
-            QPushButton[class="primary"]:hover {
-                background-color: #1976D2;
-            }
-            QPushButton[class="danger"] {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-            }
-            QPushButton[class="danger"]:hover {
-                background-color: #c82333;
-            }
-            QLabel {
-                color: #212529;
-                font-size: 14px;
-            }
-            QLabel[class="title"] {
-                font-size: 16px;
-                font-weight: bold;
-                padding: 8px;
-                margin-bottom: 8px;
-            }
-            QScrollArea {
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                background-color: white;
-            }
-        """)
+        self.setStyleSheet(SIGNATURE_PAD_STYLE)
         
         layout = QHBoxLayout(self)
         layout.setSpacing(20)  # Increased spacing between sections
@@ -418,6 +592,8 @@ class SignaturePadDialog(QDialog):
         self.content = QWidget()
         self.grid_layout = QGridLayout(self.content)
         self.grid_layout.setSpacing(15)  # Increased spacing between signatures
+        # Thumbnail clicks propagate to the container; one filter handles selection
+        self.content.installEventFilter(self)
         
         scroll.setWidget(self.content)
         right_layout.addWidget(scroll)
@@ -445,23 +621,113 @@ class SignaturePadDialog(QDialog):
         self.load_signatures()
 
     def load_signatures(self):
-        """Load saved signatures"""
-        # Clear existing signatures
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Load signatures
+        """Load saved signatures, updating only the thumbnails that changed"""
         signatures = self.signature_manager.get_all_signatures()
-        for i, sig in enumerate(signatures):
-            sig_data = self.signature_manager.get_signature_data(sig['id'])
-            if sig_data:
-                row = i // 2  # 2 signatures per row
-                col = i % 2
-                thumbnail = SignatureThumbnail(sig['id'], sig_data[0], sig['name'])
-                thumbnail.mousePressEvent = lambda e, s=sig['id']: self.select_signature(s)
-                self.grid_layout.addWidget(thumbnail, row, col)
+        # The manager hands out the same list until something changes
+        if signatures is self._shown_signatures:
+            return
+        self._shown_signatures = signatures
+        current = {sig['id']: sig for sig in signatures}
+        placeholder = None
+        
+        # Suspend repaints and relayouts so all grid changes settle in one pass
+        self.content.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        try:
+            # Remove thumbnails of deleted signatures
+            for sig_id in self._thumb_widgets.keys() - current.keys():
+                widget = self._thumb_widgets.pop(sig_id)
+                self.grid_layout.removeWidget(widget)
+                widget.deleteLater()
+            
+            # Create new thumbnails, rename existing ones and keep grid order
+            i = 0
+            for sig in signatures:
+                thumbnail = self._thumb_widgets.get(sig['id'])
+                if thumbnail is None:
+                    # Only the small thumbnail is loaded; originals are read on drag
+                    if placeholder is None:
+                        placeholder = SignatureThumbnail.placeholder_pixmap()
+                    thumbnail = SignatureThumbnail(
+                        sig['id'], sig['name'], self.signature_manager,
+                        pixmap=self._get_thumbnail_pixmap(sig, placeholder)
+                    )
+                    self._thumb_widgets[sig['id']] = thumbnail
+                else:
+                    thumbnail.set_name(sig['name'])
+                
+                row, col = divmod(i, 2)  # 2 signatures per row
+                self._place_thumbnail(thumbnail, row, col)
+                i += 1
+        finally:
+            self.grid_layout.setEnabled(True)
+            self.grid_layout.activate()
+            self.content.setUpdatesEnabled(True)
+            self.content.updateGeometry()
+    
+    def eventFilter(self, obj, event):
+        """Select the thumbnail under a click on the signature grid"""
+        if obj is self.content and event.type() == QEvent.Type.MouseButtonPress:
+            child = self.content.childAt(event.position().toPoint())
+            while child is not None and not isinstance(child, SignatureThumbnail):
+                child = child.parentWidget()
+            if child is not None:
+                self.select_signature(child.signature_id)
+        return super().eventFilter(obj, event)
+    
+    def _place_thumbnail(self, thumbnail: SignatureThumbnail, row: int, col: int):
+        """Put a thumbnail at a grid cell, leaving it alone if it is already there"""
+        index = self.grid_layout.indexOf(thumbnail)
+        if index >= 0:
+            if self.grid_layout.getItemPosition(index)[:2] == (row, col):
+                return
+            self.grid_layout.removeWidget(thumbnail)
+        self.grid_layout.addWidget(thumbnail, row, col)
+
+    @staticmethod
+    def _thumb_cache_key(signature_file: str, mtime: float) -> str:
+        """QPixmapCache key for a signature thumbnail; a changed file gets a new key"""
+        return f"sig:{signature_file}:{mtime}:{THUMBNAIL_WIDTH}x{THUMBNAIL_HEIGHT}"
+
+    def _get_thumbnail_pixmap(self, sig: Dict, placeholder: QPixmap) -> QPixmap:
+        """Get the cached thumbnail for a signature, or queue a background load and return the placeholder"""
+        try:
+            mtime = os.path.getmtime(sig['file'])
+        except OSError:
+            mtime = None
+        # The global pixmap cache outlives the dialog, so re-opening it skips decoding
+        if mtime is not None:
+            cached = QPixmapCache.find(self._thumb_cache_key(sig['file'], mtime))
+            if cached is not None and not cached.isNull():
+                return cached
+        
+        # Signatures sharing an image file (duplicates) wait on a single load
+        waiting = self._pending_thumbs.get(sig['file'])
+        if waiting is not None:
+            waiting.append(sig['id'])
+            return placeholder
+        self._pending_thumbs[sig['file']] = [sig['id']]
+        
+        task = _ThumbnailTask(sig['file'], mtime, self.signature_manager)
+        task.signals.loaded.connect(self._on_thumbnail_loaded, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(task)
+        return placeholder
+
+    def _on_thumbnail_loaded(self, signature_file: str, mtime: Optional[float], image: QImage):
+        """Swap placeholders for the decoded thumbnail"""
+        signature_ids = self._pending_thumbs.pop(signature_file, [])
+        if image.isNull():
+            return  # Keep the placeholder; the error was already reported
+        
+        pixmap = QPixmap.fromImage(image)
+        if mtime is not None:
+            QPixmapCache.insert(self._thumb_cache_key(signature_file, mtime), pixmap)
+        
+        # Signatures may have been deleted while the thumbnail was loading
+        for signature_id in signature_ids:
+            thumbnail = self._thumb_widgets.get(signature_id)
+            if thumbnail:
+                thumbnail.setPixmap(pixmap)
 
     def save_signature(self):
         """Save the current signature"""
@@ -523,7 +789,16 @@ class SignaturePadDialog(QDialog):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
+                signature = self.signature_manager.signatures.get(self.selected_signature)
+                thumb_key = None
+                if signature and os.path.exists(signature['file']):
+                    thumb_key = self._thumb_cache_key(
+                        signature['file'], os.path.getmtime(signature['file'])
+                    )
                 if self.signature_manager.delete_signature(self.selected_signature):
+                    # Drop the cached thumbnail once no signature uses the file
+                    if thumb_key and not os.path.exists(signature['file']):
+                        QPixmapCache.remove(thumb_key)
                     self.selected_signature = None
                     self.load_signatures()
                 else:
@@ -554,13 +829,18 @@ class SignaturePadDialog(QDialog):
 
     def select_signature(self, signature_id: str):
         """Select a signature with visual feedback"""
+        if signature_id == self.selected_signature:
+            return  # Clicking the selected thumbnail again changes nothing
+        
+        previous = self._thumb_widgets.get(self.selected_signature)
         self.selected_signature = signature_id
         
-        # Update selection state for all thumbnails
-        for i in range(self.grid_layout.count()):
-            widget = self.grid_layout.itemAt(i).widget()
-            if isinstance(widget, SignatureThumbnail):
-                widget.setSelected(widget.signature_id == signature_id)
+        # Only the previously and newly selected thumbnails change
+        if previous is not None:
+            previous.setSelected(False)
+        current = self._thumb_widgets.get(signature_id)
+        if current is not None:
+            current.setSelected(True)
 
     def add_date_stamp(self):
         """Add a date stamp"""
@@ -9,9 +9,13 @@ class FlowLayout(QLayout):
         self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing)
         self._items = []
+        # heightForWidth results, valid until the items change
+        self._height_cache = {}
+        self._generation = 0
         
     def addItem(self, item):
         self._items.append(item)
+        self._bump_generation()
         
     def count(self):
         return len(self._items)
@@ -23,9 +27,20 @@ class FlowLayout(QLayout):
         
     def takeAt(self, index):
         if 0 <= index < len(self._items):
+            self._bump_generation()
             return self._items.pop(index)
         return None
         
+    def _bump_generation(self):
+        """Drop cached heights after the item list changes"""
+        self._generation += 1
+        self._height_cache.clear()
+        
+    def invalidate(self):
+        # Size hints may have changed, so cached heights are stale
+        self._height_cache.clear()
+        super().invalidate()
+        
     def expandingDirections(self):
         return Qt.Orientation(0)  # Neither horizontal nor vertical
         
@@ -33,7 +48,12 @@ class FlowLayout(QLayout):
         return True
         
     def heightForWidth(self, width):
-        return self._doLayout(QRect(0, 0, width, 0), True)
+        key = (width, self._generation)
+        height = self._height_cache.get(key)
+        if height is None:
+            height = self._doLayout(QRect(0, 0, width, 0), True)
+            self._height_cache[key] = height
+        return height
         
     def setGeometry(self, rect):
         super().setGeometry(rect)
@@ -59,27 +79,34 @@ class FlowLayout(QLayout):
         line_height = 0
         spacing = self.spacing()
         
+        # All items share the parent widget's style, so query it once per pass
+        parent = self.parentWidget()
+        style = parent.style() if parent is not None else None
+        layout_spacing = style.layoutSpacing(
+            QSizePolicy.ControlType.PushButton,
+            QSizePolicy.ControlType.PushButton,
+            Qt.Orientation.Horizontal
+        ) if style is not None else 0
+        space_x = spacing + layout_spacing
+        space_y = spacing + layout_spacing
+        left = rect.x() + margin.left()
+        right = rect.right()
+        
         for item in self._items:
-            style = item.widget().style()
-            layout_spacing = style.layoutSpacing(
-                QSizePolicy.ControlType.PushButton,
-                QSizePolicy.ControlType.PushButton,
-                Qt.Orientation.Horizontal
-            )
-            space_x = spacing + layout_spacing
-            space_y = spacing + layout_spacing
+            size_hint = item.sizeHint()
+            item_width = size_hint.width()
             
-            next_x = x + item.sizeHint().width() + space_x
-            if next_x - space_x > rect.right() and line_height > 0:
-                x = rect.x() + margin.left()
+            next_x = x + item_width + space_x
+            if next_x - space_x > right and line_height > 0:
+                x = left
                 y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
+                next_x = x + item_width + space_x
                 line_height = 0
             
             if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QRect(QPoint(x, y), size_hint))
             
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            line_height = max(line_height, size_hint.height())
         
         return y + line_height - rect.y() + margin.bottom()
\ No newline at end of file
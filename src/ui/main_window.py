@@ -9,60 +9,137 @@ from PyQt6.QtGui import (
 )
 import os
 import sys
-from PyQt6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve
+import logging
+from PyQt6.QtCore import (
+    Qt, QSize, QPropertyAnimation, QEasingCurve, QTimer,
+    QObject, QRunnable, QThreadPool, QSettings, QMetaObject, Q_ARG,
+    pyqtSignal, pyqtSlot
+)
 from pathlib import Path
+from functools import lru_cache
+from typing import Dict, Optional
 
 from config.styles import (
-    TOOLBAR_STYLE, SIGN_BUTTON_STYLE, DROP_ZONE_STYLE,
-    STATUS_BAR_STYLE, TOOLBAR_ICON_SIZE, LARGE_ICON_SIZE
+    TOOLBAR_ICON_SIZE, LARGE_ICON_SIZE
 )
 
-def load_icon(name: str) -> QIcon:
-    """Load an icon from the assets directory"""
-    if getattr(sys, 'frozen', False):
-        # Running in PyInstaller bundle
-        base_path = sys._MEIPASS
-        icon_path = os.path.join(base_path, f"{name}.png")
-        if os.path.exists(icon_path):
-            return QIcon(icon_path)
-    else:
-        # Running in development
-        icon_path = str(Path(__file__).parent.parent / 'assets' / 'icons' / f"{name}.png")
-        if os.path.exists(icon_path):
-            return QIcon(icon_path)
-    
-    print(f"Icon not found: {name}.png")
-    # If no custom icon found, return system icon based on type
-    if name == 'zoom_in':
-        return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_ArrowUp)
-    elif name == 'zoom_out':
-        return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_ArrowDown)
-    elif name == 'cloud_share':
-        return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DriveNetIcon)
-    elif name == 'outlook':
-        return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DriveFDIcon)
-    return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
-
 from core.pdf_handler import PDFHandler
-from core.share_manager import ShareManager
+from core.signature_manager import SignatureManager
+from core.stamp_manager import StampManager
 from .pdf_viewer import PDFView
 from .stamp_gallery import StampGallery
-from .dialogs.signature_pad import SignaturePadDialog
 from .pdf_drag_source import PDFDragSource
 from config.constants import (
     WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, TOOLBAR_ICON_SIZE,
-    STAMPS_DIR, SIGNATURES_DIR, SUPPORTED_PDF_FORMATS
+    STAMPS_DIR, SIGNATURES_DIR, SUPPORTED_PDF_FORMATS, GALLERY_WIDTH
 )
 
+logger = logging.getLogger(__name__)
+
+# Icons ship next to the executable in a PyInstaller bundle, under assets/icons in development
+if getattr(sys, 'frozen', False):
+    _ICONS_DIR = Path(sys._MEIPASS)
+else:
+    _ICONS_DIR = Path(__file__).parent.parent / 'assets' / 'icons'
+
+# System icons used when a custom icon is missing
+_FALLBACK_ICONS = {
+    'zoom_in': QStyle.StandardPixmap.SP_ArrowUp,
+    'zoom_out': QStyle.StandardPixmap.SP_ArrowDown,
+    'cloud_share': QStyle.StandardPixmap.SP_DriveNetIcon,
+    'outlook': QStyle.StandardPixmap.SP_DriveFDIcon,
+}
+
+@lru_cache(maxsize=None)
+def load_icon(name: str) -> QIcon:
+    """Load an icon from the assets directory (each icon is looked up and decoded once)"""
+    icon_path = _ICONS_DIR / f"{name}.png"
+    if icon_path.exists():
+        return QIcon(str(icon_path))
+    
+    logger.debug("Icon not found: %s.png", name)
+    # If no custom icon found, return system icon based on type
+    standard_pixmap = _FALLBACK_ICONS.get(name, QStyle.StandardPixmap.SP_FileIcon)
+    return standard_icon(standard_pixmap)
+
+@lru_cache(maxsize=None)
+def standard_icon(standard_pixmap: QStyle.StandardPixmap) -> QIcon:
+    """Get a style's standard icon, asking the style only once per icon"""
+    return QApplication.style().standardIcon(standard_pixmap)
+
+# Document status messages are shown at most about 30 times per second
+STATUS_UPDATE_INTERVAL_MS = 33
+# Repeated fit-to-width requests within this window are applied once
+FIT_WIDTH_DELAY_MS = 50
+
+# File extensions opened when dropped on the window (compared lowercased)
+_PDF_SUFFIXES = frozenset({'.pdf'})
+
+# Name filter shared by every PDF file dialog
+_PDF_FILTER = f"PDF Files ({SUPPORTED_PDF_FORMATS})"
+
+# Custom directory icons make the file dialogs probe every folder they list,
+# which is slow on network and removable drives
+_FILE_DIALOG_OPTIONS = QFileDialog.Option.DontUseCustomDirectoryIcons
+
+# Drag formats accepted by the main window besides URLs
+_PDF_MIME_TYPES = frozenset([
+    "application/x-stamp",
+    "application/pdf",
+    "application/x-pdf",
+    "application/acrobat",
+    "application/vnd.pdf",
+    "text/pdf",
+    "text/x-pdf"
+])
+
+class _SaveSignals(QObject):
+    """Signals emitted by a document save task"""
+    finished = pyqtSignal(str)  # saved path
+    failed = pyqtSignal(str)  # path that could not be saved
+
+class _SaveTask(QRunnable):
+    """Saves the document with its annotations on the thread pool"""
+    
+    def __init__(self, pdf_handler: PDFHandler, path: str):
+        super().__init__()
+        self.pdf_handler = pdf_handler
+        self.path = path
+        # Snapshot on the GUI thread; edits made during the save don't reach this file
+        self.placements = pdf_handler.annotation_placements()
+        self.signals = _SaveSignals()
+    
+    def run(self):
+        try:
+            saved = self.pdf_handler.save_document(self.path, self.placements)
+        except Exception as e:
+            logger.exception("Error saving document: %s", e)
+            saved = False
+        if saved:
+            self.signals.finished.emit(self.path)
+        else:
+            self.signals.failed.emit(self.path)
+
+def _accepts_drag(mime_data) -> bool:
+    """Whether a drag carries URLs or one of the accepted formats"""
+    return mime_data.hasUrls() or not _PDF_MIME_TYPES.isdisjoint(mime_data.formats())
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.pdf_handler = PDFHandler()
-        self.share_manager = ShareManager()
+        self.share_manager = None  # created on first share; pulls in COM and HTTP libraries
+        
+        # Storage managers are shared for the whole session so metadata is parsed once
+        self.signature_manager = SignatureManager(str(SIGNATURES_DIR))
+        self.stamp_manager = StampManager(str(STAMPS_DIR))
+        
+        # File dialogs reopen in the last folder used, also across sessions
+        self._settings = QSettings("PySign", "MainWindow")
+        self._last_dir: str = self._settings.value("last_dir", "", type=str)
         
-        # Ensure storage directories exist
-        STAMPS_DIR.mkdir(parents=True, exist_ok=True)
-        SIGNATURES_DIR.mkdir(parents=True, exist_ok=True)
+        # Page number -> page width of the open document, for fit-to-width
+        self._page_widths: Dict[int, float] = {}
         
         self.init_ui()
 
@@ -84,9 +161,14 @@ class MainWindow(QMainWindow):
         # Enable drops on main window
         self.setAcceptDrops(True)
 
-        # Create stamp gallery
-        self.stamp_gallery = StampGallery(str(STAMPS_DIR))
-        content_layout.addWidget(self.stamp_gallery)
+        # Reserve the stamp gallery's place; the gallery loads its stamps, so it is
+        # built once the event loop is running and the window can already paint
+        self.stamp_gallery: Optional[StampGallery] = None
+        self._content_layout = content_layout
+        self._gallery_placeholder = QWidget()
+        self._gallery_placeholder.setFixedWidth(GALLERY_WIDTH)
+        content_layout.addWidget(self._gallery_placeholder)
+        QTimer.singleShot(0, self._install_stamp_gallery)
 
         # Create PDF view
         self.pdf_view = PDFView(self.pdf_handler)
@@ -100,7 +182,8 @@ class MainWindow(QMainWindow):
         self.drag_container = QFrame()
         self.drag_container.setObjectName("dragContainer")
         self.drag_container.setProperty("dragActive", "false")
-        self.drag_container.setStyleSheet(DROP_ZONE_STYLE)
+        self._drag_active = False
+        self._drag_accepted = False  # verdict for the drag in progress
         
         drag_layout = QHBoxLayout(self.drag_container)
         drag_layout.addWidget(self.drag_source)
@@ -111,111 +194,157 @@ class MainWindow(QMainWindow):
         # Create toolbar
         self.create_toolbar()
 
-        # Create status bar with modern styling
+        # Create status bar (styled by the application stylesheet)
         self.status_bar = QStatusBar()
+        self.status_bar.setObjectName("mainStatusBar")
         self.setStatusBar(self.status_bar)
-        self.status_bar.setStyleSheet(STATUS_BAR_STYLE)
         self.status_bar.showMessage("Ready")
-
-        # Connect PDF handler signals
-        self.pdf_handler.document_loaded.connect(self.on_document_loaded)
-        self.pdf_handler.page_changed.connect(self.on_page_changed)
-        self.pdf_handler.zoom_changed.connect(self.on_zoom_changed)
+        
+        # Page/zoom changes can fire on every scroll or zoom step; only the latest message is shown
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_UPDATE_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Fit-to-width is recomputed once per burst of requests
+        self._fit_timer = QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(FIT_WIDTH_DELAY_MS)
+        self._fit_timer.timeout.connect(self._do_fit_width)
+
+        # Connect PDF handler signals; queued so the handler returns to its caller
+        # before the status bar work runs on the next event loop pass
+        queued = Qt.ConnectionType.QueuedConnection
+        self.pdf_handler.document_loaded.connect(self.on_document_loaded, queued)
+        self.pdf_handler.page_changed.connect(self.on_page_changed, queued)
+        self.pdf_handler.zoom_changed.connect(self.on_zoom_changed, queued)
+
+    def _install_stamp_gallery(self):
+        """Build the stamp gallery and swap it in for its placeholder"""
+        self.stamp_gallery = StampGallery(str(STAMPS_DIR), stamp_manager=self.stamp_manager)
+        self._content_layout.replaceWidget(self._gallery_placeholder, self.stamp_gallery)
+        self._gallery_placeholder.deleteLater()
+        self._gallery_placeholder = None
 
     def create_toolbar(self):
         """Create the main toolbar with modern icons and styling"""
         toolbar = QToolBar()
+        toolbar.setObjectName("mainToolbar")
         toolbar.setIconSize(QSize(TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE))
-        toolbar.setStyleSheet(TOOLBAR_STYLE)
         self.addToolBar(toolbar)
+        
+        # Actions are collected in runs between separators and added together below
+        groups = [[]]
 
         # File actions
-        open_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton), "Open", self)
+        open_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogOpenButton), "Open", self)
         open_action.setStatusTip("Open PDF document (Ctrl+O)")
         open_action.setShortcut("Ctrl+O")
         open_action.triggered.connect(self.open_document)
-        toolbar.addAction(open_action)
+        groups[-1].append(open_action)
 
-        save_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton), "Save", self)
+        save_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogSaveButton), "Save", self)
         save_action.setStatusTip("Save PDF document (Ctrl+S)")
         save_action.setShortcut("Ctrl+S")
         save_action.triggered.connect(self.save_document)
-        toolbar.addAction(save_action)
+        groups[-1].append(save_action)
 
-        toolbar.addSeparator()
+        groups.append([])
 
         # Navigation actions
-        prev_page = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowLeft), "Previous", self)
+        prev_page = QAction(standard_icon(QStyle.StandardPixmap.SP_ArrowLeft), "Previous", self)
         prev_page.setStatusTip("Go to previous page (Left Arrow)")
         prev_page.setShortcut("Left")
         prev_page.triggered.connect(self.previous_page)
-        toolbar.addAction(prev_page)
+        groups[-1].append(prev_page)
 
-        next_page = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowRight), "Next", self)
+        next_page = QAction(standard_icon(QStyle.StandardPixmap.SP_ArrowRight), "Next", self)
         next_page.setStatusTip("Go to next page (Right Arrow)")
         next_page.setShortcut("Right")
         next_page.triggered.connect(self.next_page)
-        toolbar.addAction(next_page)
+        groups[-1].append(next_page)
 
-        toolbar.addSeparator()
+        groups.append([])
 
         # Zoom actions
         zoom_in = QAction(load_icon('zoom_in'), "Zoom In (+)", self)
         zoom_in.setStatusTip("Zoom in (Ctrl++)")
         zoom_in.setShortcut("Ctrl++")
         zoom_in.triggered.connect(self.zoom_in)
-        toolbar.addAction(zoom_in)
+        groups[-1].append(zoom_in)
 
         zoom_out = QAction(load_icon('zoom_out'), "Zoom Out (-)", self)
         zoom_out.setStatusTip("Zoom out (Ctrl+-)")
         zoom_out.setShortcut("Ctrl+-")
         zoom_out.triggered.connect(self.zoom_out)
-        toolbar.addAction(zoom_out)
+        groups[-1].append(zoom_out)
 
-        fit_width = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowDown), "Fit Width", self)
+        fit_width = QAction(standard_icon(QStyle.StandardPixmap.SP_ArrowDown), "Fit Width", self)
         fit_width.setStatusTip("Fit to width (Ctrl+W)")
         fit_width.setShortcut("Ctrl+W")
         fit_width.triggered.connect(self.fit_width)
-        toolbar.addAction(fit_width)
+        groups[-1].append(fit_width)
 
-        toolbar.addSeparator()
+        groups.append([])
 
         # Signature actions
-        signature_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon), "Draw Signature", self)
+        signature_action = QAction(standard_icon(QStyle.StandardPixmap.SP_FileIcon), "Draw Signature", self)
         signature_action.setStatusTip("Open signature pad to draw or import signatures (Ctrl+G)")
         signature_action.setShortcut("Ctrl+G")
         signature_action.triggered.connect(self.show_signature_pad)
-        toolbar.addAction(signature_action)
+        groups[-1].append(signature_action)
         
         # Add Sign button with prominent styling and larger icon
-        sign_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton), "Sign", self)
+        sign_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogApplyButton), "Sign", self)
         sign_action.setStatusTip("Sign and save the document (Ctrl+Enter)")
         sign_action.setShortcut("Ctrl+Return")
         sign_action.triggered.connect(self.sign_document)
         sign_action.setProperty("class", "primary")
-        toolbar.addAction(sign_action)
-        
-        # Apply custom styling to the toolbar and sign button
-        toolbar.setStyleSheet(TOOLBAR_STYLE + SIGN_BUTTON_STYLE)
+        groups[-1].append(sign_action)
         
-        toolbar.addSeparator()
+        groups.append([])
         
         # Share actions
         email_action = QAction(load_icon('outlook'), "Share via Outlook", self)
         email_action.setStatusTip("Share via Outlook email (Ctrl+E)")
         email_action.setShortcut("Ctrl+E")
         email_action.triggered.connect(self.share_via_email)
-        toolbar.addAction(email_action)
+        groups[-1].append(email_action)
         
         whatsapp_action = QAction(load_icon('cloud_share'), "Share Online", self)
-        whatsapp_action.setStatusTip("Share via WhatsApp Web (Ctrl+W)")
-        whatsapp_action.setShortcut("Ctrl+W")
+        whatsapp_action.setStatusTip("Share via WhatsApp Web (Ctrl+Shift+W)")
+        whatsapp_action.setShortcut("Ctrl+Shift+W")  # Ctrl+W is Fit Width
         whatsapp_action.triggered.connect(self.share_via_whatsapp)
-        toolbar.addAction(whatsapp_action)
+        groups[-1].append(whatsapp_action)
         
-    def share_via_whatsapp(self):
-        """Share the current document via WhatsApp"""
-        if not self.pdf_handler.document:
+        # Actions that save or replace the document, disabled while a signed save runs
+        self._document_actions = (
+            open_action, save_action, sign_action, email_action, whatsapp_action
+        )
+        
+        # One addActions call per run, with repaints suspended until all are in
+        toolbar.setUpdatesEnabled(False)
+        try:
+            for index, group in enumerate(groups):
+                if index:
+                    toolbar.addSeparator()
+                toolbar.addActions(group)
+        finally:
+            toolbar.setUpdatesEnabled(True)
+
+    def _get_share_manager(self):
+        """Get the share manager, importing and creating it on first use"""
+        if self.share_manager is None:
+            from core.share_manager import ShareManager
+            self.share_manager = ShareManager()
+        return self.share_manager
+
+    def _share_document(self, share_fn):
+        """Save the document to a chosen file and hand it to a share function.
+        The share itself runs in the background and reports its own errors;
+        share_fn returns False only when the saved file can't be read back."""
+        if self.pdf_handler.document is None:
             QMessageBox.warning(
                 self,
                 "Warning",
@@ -227,18 +356,19 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Document for Sharing",
-            "",
-            f"PDF Files ({SUPPORTED_PDF_FORMATS})"
+            self._last_dir,
+            _PDF_FILTER,
+            options=_FILE_DIALOG_OPTIONS
         )
         
         if file_path:
+            self._remember_dir(file_path)
             if self.pdf_handler.save_document(file_path):
-                # Share via WhatsApp
-                if not self.share_manager.share_via_whatsapp(file_path):
+                if not share_fn(file_path):
                     QMessageBox.critical(
                         self,
                         "Error",
-                        "Failed to open WhatsApp Web. Please try again."
+                        "Could not access the saved document for sharing."
                     )
             else:
                 QMessageBox.critical(
@@ -246,59 +376,53 @@ class MainWindow(QMainWindow):
                     "Error",
                     "Failed to save the document for sharing."
                 )
+
+    @pyqtSlot()
+    def share_via_whatsapp(self):
+        """Share the current document via WhatsApp"""
+        self._share_document(
+            lambda path: self._get_share_manager().share_via_whatsapp(path)
+        )
         
+    @pyqtSlot()
     def share_via_email(self):
         """Share the current document via email"""
-        if not self.pdf_handler.document:
-            QMessageBox.warning(
-                self,
-                "Warning",
-                "Please open a document first."
+        self._share_document(
+            lambda path: self._get_share_manager().share_via_email(
+                path,
+                "",  # No default subject
+                ""   # No default body
             )
-            return
-            
-        # Save current document to temporary file
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Document for Sharing",
-            "",
-            f"PDF Files ({SUPPORTED_PDF_FORMATS})"
         )
-        
-        if file_path:
-            if self.pdf_handler.save_document(file_path):
-                # Share via email
-                if not self.share_manager.share_via_email(
-                    file_path,
-                    "",  # No default subject
-                    ""   # No default body
-                ):
-                    QMessageBox.critical(
-                        self,
-                        "Error",
-                        "Failed to create email. Please check if Outlook is installed and running."
-                    )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to save the document for sharing."
-                )
 
+    @pyqtSlot()
     def show_signature_pad(self):
         """Show the signature pad dialog"""
-        dialog = SignaturePadDialog(self)
+        from .dialogs.signature_pad import SignaturePadDialog
+        dialog = SignaturePadDialog(self, signature_manager=self.signature_manager)
         dialog.exec()
 
+    def _remember_dir(self, file_path: str):
+        """Start the next file dialog in the folder of a chosen file"""
+        self._last_dir = str(Path(file_path).parent)
+
+    def closeEvent(self, event):
+        """Persist the last used folder"""
+        self._settings.setValue("last_dir", self._last_dir)
+        super().closeEvent(event)
+
+    @pyqtSlot()
     def open_document(self):
         """Open a PDF document"""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Open PDF Document",
-            "",
-            f"PDF Files ({SUPPORTED_PDF_FORMATS})"
+            self._last_dir,
+            _PDF_FILTER,
+            options=_FILE_DIALOG_OPTIONS
         )
         if file_path:
+            self._remember_dir(file_path)
             if not self.pdf_handler.open_document(file_path):
                 QMessageBox.critical(
                     self,
@@ -306,15 +430,18 @@ class MainWindow(QMainWindow):
                     "Failed to open the PDF document."
                 )
 
+    @pyqtSlot()
     def save_document(self):
         """Save the PDF document"""
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save PDF Document",
-            "",
-            f"PDF Files ({SUPPORTED_PDF_FORMATS})"
+            self._last_dir,
+            _PDF_FILTER,
+            options=_FILE_DIALOG_OPTIONS
         )
         if file_path:
+            self._remember_dir(file_path)
             if not self.pdf_handler.save_document(file_path):
                 QMessageBox.critical(
                     self,
@@ -322,11 +449,12 @@ class MainWindow(QMainWindow):
                     "Failed to save the PDF document."
                 )
                 
+    @pyqtSlot()
     def sign_document(self):
         """Sign and save the document automatically"""
-        print("\n=== Signing Document ===")
-        if not self.pdf_handler.document:
-            print("No document loaded")
+        logger.debug("Signing document")
+        if self.pdf_handler.document is None:
+            logger.debug("No document loaded")
             QMessageBox.warning(
                 self,
                 "Warning",
@@ -337,10 +465,10 @@ class MainWindow(QMainWindow):
         try:
             # Get the path for the signed document
             signed_path = self.pdf_handler.get_signed_path()
-            print(f"Generated signed path: {signed_path}")
+            logger.debug("Generated signed path: %s", signed_path)
             
             if not signed_path:
-                print("Failed to generate signed path")
+                logger.debug("Failed to generate signed path")
                 QMessageBox.critical(
                     self,
                     "Error",
@@ -348,144 +476,192 @@ class MainWindow(QMainWindow):
                 )
                 return
                 
-            # Save the document
-            print(f"Attempting to save document to: {signed_path}")
-            if self.pdf_handler.save_document():
-                print("Document saved successfully")
-                self.status_bar.showMessage(f"Document signed and saved to: {signed_path}")
-                # Update drag source with the new file
-                print("Updating drag source with new file")
-                self.drag_source.setPDFPath(signed_path)
-            else:
-                print("Failed to save document")
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to save the signed document."
-                )
+            # Save the document in the background; actions that save or replace
+            # the document stay disabled until it finishes
+            logger.debug("Attempting to save document to: %s", signed_path)
+            self._set_document_actions_enabled(False)
+            self._show_status(f"Saving signed document to: {signed_path}")
+            task = _SaveTask(self.pdf_handler, signed_path)
+            task.signals.finished.connect(self._on_sign_saved, Qt.ConnectionType.QueuedConnection)
+            task.signals.failed.connect(self._on_sign_failed, Qt.ConnectionType.QueuedConnection)
+            QThreadPool.globalInstance().start(task)
         except Exception as e:
-            print(f"Error during signing: {e}")
+            self._set_document_actions_enabled(True)
+            logger.exception("Error during signing: %s", e)
             QMessageBox.critical(
                 self,
                 "Error",
                 f"An error occurred while signing the document: {str(e)}"
             )
 
+    def _set_document_actions_enabled(self, enabled: bool):
+        """Enable or disable the actions that save or replace the document"""
+        for action in self._document_actions:
+            action.setEnabled(enabled)
+
+    @pyqtSlot(str)
+    def _on_sign_saved(self, signed_path: str):
+        """Report a completed signed save and offer the file for dragging"""
+        logger.debug("Document saved successfully")
+        self._set_document_actions_enabled(True)
+        self._show_status(f"Document signed and saved to: {signed_path}")
+        # Update drag source with the new file
+        logger.debug("Updating drag source with new file")
+        self.drag_source.setPDFPath(signed_path)
+
+    @pyqtSlot(str)
+    def _on_sign_failed(self, signed_path: str):
+        """Report a failed signed save"""
+        logger.debug("Failed to save document")
+        self._set_document_actions_enabled(True)
+        self._show_status("Ready")
+        QMessageBox.critical(
+            self,
+            "Error",
+            "Failed to save the signed document."
+        )
+
+    @pyqtSlot()
     def previous_page(self):
         """Go to the previous page"""
-        if self.pdf_handler.document:
+        if self.pdf_handler.document is not None:
             self.pdf_handler.navigate_to_page(self.pdf_handler.current_page - 1)
 
+    @pyqtSlot()
     def next_page(self):
         """Go to the next page"""
-        if self.pdf_handler.document:
+        if self.pdf_handler.document is not None:
             self.pdf_handler.navigate_to_page(self.pdf_handler.current_page + 1)
 
+    @pyqtSlot()
     def zoom_in(self):
         """Zoom in the document view"""
-        if self.pdf_handler.document:
+        if self.pdf_handler.document is not None:
             self.pdf_handler.set_zoom(self.pdf_handler.zoom_level * 1.2)
 
+    @pyqtSlot()
     def zoom_out(self):
         """Zoom out the document view"""
-        if self.pdf_handler.document:
+        if self.pdf_handler.document is not None:
             self.pdf_handler.set_zoom(self.pdf_handler.zoom_level / 1.2)
 
+    @pyqtSlot()
     def fit_width(self):
-        """Fit document to window width"""
-        if self.pdf_handler.document:
+        """Fit document to window width (applied after a short delay)"""
+        # Restarting the timer drops the pending fit, so only the last request runs
+        self._fit_timer.start()
+
+    def _do_fit_width(self):
+        """Set the zoom so the current page fills the view width"""
+        if self.pdf_handler.document is not None:
             # Calculate zoom level based on window and page width
-            page_info = self.pdf_handler.get_page_info(self.pdf_handler.current_page)
-            if page_info:
-                view_width = self.pdf_view.width() - self.stamp_gallery.width()
-                zoom = view_width / page_info.size[0]
+            page_width = self._page_width(self.pdf_handler.current_page)
+            if page_width:
+                gallery_width = self.stamp_gallery.width() if self.stamp_gallery else GALLERY_WIDTH
+                view_width = self.pdf_view.width() - gallery_width
+                zoom = view_width / page_width
                 self.pdf_handler.set_zoom(zoom)
 
+    def _page_width(self, page_number: int) -> Optional[float]:
+        """Get a page's width, querying the document only the first time"""
+        width = self._page_widths.get(page_number)
+        if width is None:
+            page_info = self.pdf_handler.get_page_info(page_number)
+            if page_info is None:
+                return None
+            width = self._page_widths[page_number] = page_info.size[0]
+        return width
+
+    def _show_status(self, message: str):
+        """Show a status message unless it is already the one displayed"""
+        # A message shown directly is newer than any queued one
+        self._pending_status = None
+        # Compared with the bar itself, since action status tips replace its text too
+        if message != self.status_bar.currentMessage():
+            self.status_bar.showMessage(message)
+
+    @pyqtSlot(str)
+    def _queue_status(self, message: str):
+        """Show a status message, coalescing bursts into one update per interval"""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Show the most recent queued status message"""
+        if self._pending_status is not None:
+            self._show_status(self._pending_status)
+            self._pending_status = None
+
     # Signal handlers
+    @pyqtSlot(bool)
     def on_document_loaded(self, success: bool):
         """Handle document loaded signal"""
+        self._page_widths.clear()
         if success:
-            self.status_bar.showMessage("Document loaded successfully")
-            # Reset drag source when new document is loaded
-            self.drag_source.setPDFPath(None)
+            self._queue_status("Document loaded successfully")
         else:
-            self.status_bar.showMessage("Failed to load document")
+            self._queue_status("Failed to load document")
+        # Reset drag source when a new document is loaded, unless it is already clear
+        if self.drag_source.pdf_path is not None:
             self.drag_source.setPDFPath(None)
 
+    @pyqtSlot(int, int)
     def on_page_changed(self, current: int, total: int):
         """Handle page changed signal"""
-        self.status_bar.showMessage(f"Page {current + 1} of {total}")
+        self._queue_status(f"Page {current + 1} of {total}")
+        # Look up the next page's width while idle so fit-to-width is ready after a page turn
+        if current + 1 < total:
+            QTimer.singleShot(0, lambda: self._page_width(current + 1))
 
+    @pyqtSlot(float)
     def on_zoom_changed(self, zoom: float):
         """Handle zoom changed signal"""
         zoom_percent = int(zoom * 100)
-        self.status_bar.showMessage(f"Zoom: {zoom_percent}%")
+        self._queue_status(f"Zoom: {zoom_percent}%")
 
-    def dragEnterEvent(self, event: QDragEnterEvent):
-        """Handle drag enter events with visual feedback"""
-        mime_data = event.mimeData()
-        
-        # Accept any drag that has URLs
-        if mime_data.hasUrls():
-            self.drag_container.setProperty("dragActive", "true")
-            self.drag_container.setStyleSheet(DROP_ZONE_STYLE)
-            self.status_bar.showMessage("Drop PDF files here to open")
-            event.acceptProposedAction()
+    def _set_drag_active(self, active: bool):
+        """Highlight the drop zone, re-polishing only when the state changes"""
+        if active == self._drag_active:
             return
-            
-        # Accept PDF-related MIME types
-        pdf_mime_types = [
-            "application/x-stamp",
-            "application/pdf",
-            "application/x-pdf",
-            "application/acrobat",
-            "application/vnd.pdf",
-            "text/pdf",
-            "text/x-pdf"
-        ]
+        self._drag_active = active
+        # DROP_ZONE_STYLE is part of the application stylesheet; re-polish to apply [dragActive]
+        self.drag_container.setProperty("dragActive", "true" if active else "false")
+        style = self.drag_container.style()
+        style.unpolish(self.drag_container)
+        style.polish(self.drag_container)
+
+    def _accept_pdf_drag(self, event, update_ui: bool) -> bool:
+        """Accept or ignore a drag, checking its formats only when it enters"""
+        # The dragged data cannot change mid-drag, so moves reuse the verdict from enter
+        if update_ui:
+            mime_data = event.mimeData()
+            self._drag_accepted = _accepts_drag(mime_data)
+            if self._drag_accepted:
+                self._set_drag_active(True)
+                if mime_data.hasUrls():
+                    self._show_status("Drop PDF files here to open")
+                else:
+                    self._show_status("Drop to add signature or stamp")
         
-        for mime_type in pdf_mime_types:
-            if mime_data.hasFormat(mime_type):
-                self.drag_container.setProperty("dragActive", "true")
-                self.drag_container.setStyleSheet(DROP_ZONE_STYLE)
-                self.status_bar.showMessage("Drop to add signature or stamp")
-                event.acceptProposedAction()
-                return
-                
-        event.ignore()
+        if self._drag_accepted:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+        return self._drag_accepted
+
+    def dragEnterEvent(self, event: QDragEnterEvent):
+        """Handle drag enter events with visual feedback"""
+        self._accept_pdf_drag(event, update_ui=True)
 
     def dragLeaveEvent(self, event):
         """Handle drag leave events"""
-        self.drag_container.setProperty("dragActive", "false")
-        self.drag_container.setStyleSheet(DROP_ZONE_STYLE)
-        self.status_bar.showMessage("Ready")
+        self._set_drag_active(False)
+        self._show_status("Ready")
 
     def dragMoveEvent(self, event: QDragMoveEvent):
         """Handle drag move events"""
-        mime_data = event.mimeData()
-        
-        # Accept any drag that has URLs
-        if mime_data.hasUrls():
-            event.acceptProposedAction()
-            return
-            
-        # Accept PDF-related MIME types
-        pdf_mime_types = [
-            "application/x-stamp",
-            "application/pdf",
-            "application/x-pdf",
-            "application/acrobat",
-            "application/vnd.pdf",
-            "text/pdf",
-            "text/x-pdf"
-        ]
-        
-        for mime_type in pdf_mime_types:
-            if mime_data.hasFormat(mime_type):
-                event.acceptProposedAction()
-                return
-                
-        event.ignore()
+        self._accept_pdf_drag(event, update_ui=False)
 
     def dropEvent(self, event: QDropEvent):
         """Handle drop events with visual feedback"""
@@ -493,26 +669,31 @@ class MainWindow(QMainWindow):
         
         try:
             # Reset drag container state
-            self.drag_container.setProperty("dragActive", "false")
-            self.drag_container.setStyleSheet(DROP_ZONE_STYLE)
+            self._set_drag_active(False)
             
-            # Handle URL drops
-            if mime_data.hasUrls():
-                for url in mime_data.urls():
-                    if url.isLocalFile():
-                        file_path = url.toLocalFile()
-                        if file_path.lower().endswith('.pdf'):
-                            if self.pdf_handler.open_document(file_path):
-                                self.status_bar.showMessage(f"Successfully opened: {file_path}")
-                                event.acceptProposedAction()
-                                return
+            # Handle URL drops: open the first local PDF (urls() is empty for other drags)
+            for url in mime_data.urls():
+                if not url.isLocalFile():
+                    continue
+                file_path = url.toLocalFile()
+                # Lowercase only the extension rather than the whole path
+                if (os.path.splitext(file_path)[1].lower() in _PDF_SUFFIXES
+                        and self.pdf_handler.open_document(file_path)):
+                    # Queued behind the handler's load/page signals, so their
+                    # status messages don't replace the confirmation
+                    QMetaObject.invokeMethod(
+                        self, "_queue_status", Qt.ConnectionType.QueuedConnection,
+                        Q_ARG(str, f"Successfully opened: {file_path}")
+                    )
+                    event.acceptProposedAction()
+                    return
             
-            # Forward other drops to PDF view
+            # Forward other drops (stamps, signatures, non-PDF URLs) to PDF view
             self.pdf_view.dropEvent(event)
             
         except Exception as e:
-            print(f"Error handling drop event: {e}")
-            self.status_bar.showMessage(f"Error: {str(e)}")
+            logger.exception("Error handling drop event: %s", e)
+            self._show_status(f"Error: {str(e)}")
             event.ignore()
             
-        self.status_bar.showMessage("Ready")
\ No newline at end of file
+        self._show_status("Ready")
\ No newline at end of file
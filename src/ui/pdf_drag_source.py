@@ -1,14 +1,38 @@
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QFrame
 from PyQt6.QtGui import QPainter, QColor, QPen, QDrag, QPixmap, QPainterPath
 from PyQt6.QtCore import Qt, QMimeData, QPoint, QSize, QUrl
-import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+# One sheet for every state; hover and the drag-enabled look come from selectors,
+# so state changes only flip the dragEnabled property
+DRAG_FRAME_STYLE = sys.intern("""
+    QFrame#dragFrame {
+        background-color: #f8f9fa;
+        border: 2px dashed #dee2e6;
+        border-radius: 8px;
+    }
+    QFrame#dragFrame[dragEnabled="true"] {
+        background-color: #e9ecef;
+        border-color: #adb5bd;
+    }
+    QFrame#dragFrame[dragEnabled="true"]:hover {
+        background-color: #dee2e6;
+        border-color: #6c757d;
+    }
+""")
 
 class PDFDragSource(QWidget):
     """Widget that provides a draggable area for signed PDFs"""
     
+    # Drag feedback never changes, so it is painted once and shared by all instances
+    _drag_pixmap: Optional[QPixmap] = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.pdf_path = None
+        self._drag_url: Optional[QUrl] = None  # built once in setPDFPath
         self.drag_enabled = False
         self.setMinimumHeight(100)
         self.setMinimumWidth(200)
@@ -21,17 +45,8 @@ class PDFDragSource(QWidget):
         # Create frame with custom styling
         self.frame = QFrame()
         self.frame.setObjectName("dragFrame")
-        self.frame.setStyleSheet("""
-            QFrame#dragFrame {
-                background-color: #f8f9fa;
-                border: 2px dashed #dee2e6;
-                border-radius: 8px;
-            }
-            QFrame#dragFrame:hover {
-                background-color: #e9ecef;
-                border-color: #adb5bd;
-            }
-        """)
+        self.frame.setProperty("dragEnabled", "false")
+        self.frame.setStyleSheet(DRAG_FRAME_STYLE)
         
         # Add label
         self.label = QLabel("Drag signed PDF from here")
@@ -53,37 +68,28 @@ class PDFDragSource(QWidget):
     def setPDFPath(self, path: str):
         """Set the path of the PDF to be dragged"""
         self.pdf_path = path
-        self.drag_enabled = bool(path and os.path.exists(path))
+        # Resolve and check the file once here rather than on every click
+        resolved = Path(path).resolve() if path else None
+        self.drag_enabled = bool(resolved and resolved.exists())
+        self._drag_url = QUrl.fromLocalFile(str(resolved)) if self.drag_enabled else None
         
         # Update label and styling based on state
         if self.drag_enabled:
             self.label.setText("← Drag signed PDF from here")
             self.setCursor(Qt.CursorShape.OpenHandCursor)
-            self.frame.setStyleSheet("""
-                QFrame#dragFrame {
-                    background-color: #e9ecef;
-                    border: 2px dashed #adb5bd;
-                    border-radius: 8px;
-                }
-                QFrame#dragFrame:hover {
-                    background-color: #dee2e6;
-                    border-color: #6c757d;
-                }
-            """)
         else:
             self.label.setText("No signed PDF available")
             self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.frame.setStyleSheet("""
-                QFrame#dragFrame {
-                    background-color: #f8f9fa;
-                    border: 2px dashed #dee2e6;
-                    border-radius: 8px;
-                }
-            """)
+        
+        enabled = "true" if self.drag_enabled else "false"
+        if self.frame.property("dragEnabled") != enabled:
+            self.frame.setProperty("dragEnabled", enabled)
+            self.frame.style().unpolish(self.frame)
+            self.frame.style().polish(self.frame)
             
     def mousePressEvent(self, event):
         """Handle mouse press to start drag operation"""
-        if not self.drag_enabled or not self.pdf_path or not os.path.exists(self.pdf_path):
+        if not self.drag_enabled:
             return
             
         if event.button() == Qt.MouseButton.LeftButton:
@@ -92,10 +98,8 @@ class PDFDragSource(QWidget):
                 drag = QDrag(self)
                 mime_data = QMimeData()
                 
-                # Add URL to mime data
-                file_path = os.path.abspath(self.pdf_path)
-                url = QUrl.fromLocalFile(file_path)
-                mime_data.setUrls([url])
+                # Add URL to mime data (QDrag owns the mime data, so only the URL is reused)
+                mime_data.setUrls([self._drag_url])
                 
                 # Create drag feedback pixmap
                 pixmap = self._createDragPixmap()
@@ -117,8 +121,16 @@ class PDFDragSource(QWidget):
             except:
                 self.setCursor(Qt.CursorShape.OpenHandCursor)
             
-    def _createDragPixmap(self) -> QPixmap:
-        """Create a pixmap for drag feedback"""
+    @classmethod
+    def _createDragPixmap(cls) -> QPixmap:
+        """Get the pixmap for drag feedback, painting it on first use"""
+        if cls._drag_pixmap is None:
+            cls._drag_pixmap = cls._paintDragPixmap()
+        return cls._drag_pixmap
+        
+    @staticmethod
+    def _paintDragPixmap() -> QPixmap:
+        """Paint the drag feedback pixmap"""
         # Create base pixmap
         size = QSize(200, 60)
         pixmap = QPixmap(size)
@@ -144,30 +156,4 @@ class PDFDragSource(QWidget):
         painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "Signed PDF")
         
         painter.end()
-        return pixmap
-        
-    def enterEvent(self, event):
-        """Handle mouse enter event"""
-        if self.drag_enabled:
-            self.frame.setStyleSheet("""
-                QFrame#dragFrame {
-                    background-color: #dee2e6;
-                    border: 2px dashed #6c757d;
-                    border-radius: 8px;
-                }
-            """)
-            
-    def leaveEvent(self, event):
-        """Handle mouse leave event"""
-        if self.drag_enabled:
-            self.frame.setStyleSheet("""
-                QFrame#dragFrame {
-                    background-color: #e9ecef;
-                    border: 2px dashed #adb5bd;
-                    border-radius: 8px;
-                }
-                QFrame#dragFrame:hover {
-                    background-color: #dee2e6;
-                    border-color: #6c757d;
-                }
-            """)
\ No newline at end of file
+        return pixmap
\ No newline at end of file
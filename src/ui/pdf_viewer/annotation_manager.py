@@ -62,6 +62,13 @@ class AnnotationManager:
             logger.error(f"Error getting annotation by index: {e}")
             return None
             
+    def get_annotation_by_id(self, annotation_id: int) -> Optional[Annotation]:
+        """Get annotation by the id assigned by PDFHandler"""
+        for annotation in self.annotations:
+            if annotation.id == annotation_id:
+                return annotation
+        return None
+            
     def clear_state(self) -> None:
         """Clear the viewport state"""
         self.state = ViewportState()
@@ -1,8 +1,9 @@
 """Handles caching and scaling of images"""
 
 from PyQt6.QtGui import QImage
-from PIL import Image
+from PIL import Image, ImageChops
 from io import BytesIO
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Dict, Tuple
 import logging
@@ -11,6 +12,41 @@ logger = logging.getLogger(__name__)
 
 # Constants
 MAX_CACHE_SIZE = 100
+MAX_TINTED_SOURCES = 16  # Full-size tinted stamps kept for rescaling
+
+def _tint_image(img: Image.Image, color: str) -> Image.Image:
+    """Apply a color tint to the non-white pixels of an RGBA image
+    
+    Each colored pixel becomes the tint color scaled by its darkness; white
+    pixels are kept and fully transparent pixels are cleared. Works on whole
+    bands with Pillow instead of looping over pixels in Python.
+    """
+    # Convert hex color to RGB
+    r = int(color[1:3], 16)
+    g = int(color[3:5], 16)
+    b = int(color[5:7], 16)
+    logger.debug(f"RGB values: r={r}, g={g}, b={b}")
+    
+    red, green, blue, alpha = img.split()
+    rgb = img.convert('RGB')
+    
+    # Preserve relative darkness by scaling the color with the pixel's mean brightness
+    brightness = rgb.convert('L', (1 / 3, 1 / 3, 1 / 3, 0))
+    tinted = Image.merge('RGB', [
+        brightness.point(lambda v, c=c: int(c * (0.5 + v / 510))) for c in (r, g, b)
+    ])
+    
+    # Pixels with all channels above 240 count as white and keep their color
+    white = red.point(lambda v: 255 if v > 240 else 0)
+    white = ImageChops.multiply(white, green.point(lambda v: 255 if v > 240 else 0))
+    white = ImageChops.multiply(white, blue.point(lambda v: 255 if v > 240 else 0))
+    rgb = Image.composite(tinted, rgb, ImageChops.invert(white))
+    
+    # Keep transparent pixels blank
+    visible = alpha.point(lambda v: 255 if v > 0 else 0)
+    rgb = Image.composite(rgb, Image.new('RGB', img.size), visible)
+    
+    return Image.merge('RGBA', (*rgb.split(), alpha))
 
 class ImageCache:
     """Handles caching of scaled images with LRU cache"""
@@ -23,6 +59,8 @@ class ImageCache:
         """
         self._cache: Dict[Tuple, QImage] = {}
         self._max_size = max_size
+        # (image_data, color) -> tinted full-size image, so resizing skips re-tinting
+        self._tinted: OrderedDict[Tuple[bytes, str], Image.Image] = OrderedDict()
         
     def get_scaled_image(self, image_data: bytes, width: int, height: int, color: str = None) -> QImage:
         """Get a scaled and optionally colored version of the image, using cache if available
@@ -47,86 +85,81 @@ class ImageCache:
                 return self._cache[cache_key]
             logger.debug(f"Cache miss for key: {cache_key}")
             
-            # Scale image using Pillow for better quality
-            with Image.open(BytesIO(image_data)) as img:
-                # Convert to RGBA if needed
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-                
-                # Resize with high quality
-                img = img.resize(
-                    (width, height),
-                    Image.Resampling.LANCZOS
-                )
-                
-                # Only apply color tint if a custom color is specified (not the default black)
-                if color and color.lower() != '#000000':
-                    logger.debug(f"Applying custom color tint: {color} to non-white pixels")
-                    try:
-                        # Convert hex color to RGB
-                        r = int(color[1:3], 16)
-                        g = int(color[3:5], 16)
-                        b = int(color[5:7], 16)
-                        logger.debug(f"RGB values: r={r}, g={g}, b={b}")
-                        
-                        # Get image data as array
-                        data = img.getdata()
-                        new_data = []
-                        
-                        # Apply color to each pixel while preserving alpha
-                        for item in data:
-                            # Get alpha value from original pixel
-                            alpha = item[3] if len(item) > 3 else 255
-                            if alpha > 0:  # Only process non-transparent pixels
-                                # Check if pixel is not white (allowing for some variation)
-                                is_colored = not (item[0] > 240 and item[1] > 240 and item[2] > 240)
-                                if is_colored:
-                                    # Replace non-white pixels with selected color
-                                    # Preserve relative darkness by scaling the color
-                                    darkness = 1.0 - (sum(item[:3]) / (3 * 255))  # 0.0 to 1.0
-                                    new_r = int(r * (1.0 - darkness * 0.5))  # Scale color by darkness
-                                    new_g = int(g * (1.0 - darkness * 0.5))
-                                    new_b = int(b * (1.0 - darkness * 0.5))
-                                    new_data.append((new_r, new_g, new_b, alpha))
-                                else:
-                                    # Keep white pixels unchanged
-                                    new_data.append(item)
-                            else:
-                                new_data.append((0, 0, 0, 0))  # Keep transparent pixels
-                        
-                        # Create new image with colored data
-                        img.putdata(new_data)
-                        logger.debug("Custom color tint applied successfully")
-                    except Exception as e:
-                        logger.error(f"Error applying color tint: {e}")
-                else:
-                    logger.debug("Using default stamp appearance (no custom color)")
-                
-                # Convert to QImage
-                data = img.tobytes("raw", "RGBA")
-                qimg = QImage(
-                    data,
-                    img.width,
-                    img.height,
-                    QImage.Format.Format_RGBA8888
-                )
-                
-                # Cache the result
-                self._cache[cache_key] = qimg
-                
-                # Maintain cache size
-                if len(self._cache) > self._max_size:
-                    self._cache.pop(next(iter(self._cache)))
-                
-                return qimg
+            # Scale image using Pillow for better quality (resize returns a new
+            # image, so the cached tinted source is left untouched)
+            img = self._load_source(image_data, color)
+            img = img.resize(
+                (width, height),
+                Image.Resampling.LANCZOS
+            )
+            
+            # Convert to QImage
+            data = img.tobytes("raw", "RGBA")
+            qimg = QImage(
+                data,
+                img.width,
+                img.height,
+                QImage.Format.Format_RGBA8888
+            )
+            
+            # Cache the result
+            self._cache[cache_key] = qimg
+            
+            # Maintain cache size
+            if len(self._cache) > self._max_size:
+                self._cache.pop(next(iter(self._cache)))
+            
+            return qimg
                 
         except Exception as e:
             logger.error(f"Error scaling image: {e}")
             return QImage()
             
+    def _load_source(self, image_data: bytes, color: str = None) -> Image.Image:
+        """Decode an image as RGBA, tinted if a custom color is given
+        
+        Tinted images are cached at full size, so placing or resizing a stamp
+        of the same color again only needs a resize.
+        """
+        # Only apply color tint if a custom color is specified (not the default black)
+        if not color or color.lower() == '#000000':
+            logger.debug("Using default stamp appearance (no custom color)")
+            return self._decode(image_data)
+        
+        key = (image_data, color.lower())
+        tinted = self._tinted.get(key)
+        if tinted is not None:
+            self._tinted.move_to_end(key)
+            return tinted
+        
+        img = self._decode(image_data)
+        logger.debug(f"Applying custom color tint: {color} to non-white pixels")
+        try:
+            img = _tint_image(img, color)
+            logger.debug("Custom color tint applied successfully")
+        except Exception as e:
+            logger.error(f"Error applying color tint: {e}")
+            return img
+        
+        self._tinted[key] = img
+        if len(self._tinted) > MAX_TINTED_SOURCES:
+            self._tinted.popitem(last=False)
+        return img
+        
+    @staticmethod
+    def _decode(image_data: bytes) -> Image.Image:
+        """Decode image data into an RGBA image"""
+        with Image.open(BytesIO(image_data)) as img:
+            # Convert to RGBA if needed
+            if img.mode != 'RGBA':
+                return img.convert('RGBA')
+            img.load()
+            return img.copy()
+        
     def clear(self) -> None:
         """Clear the image cache"""
         logger.debug("Clearing image cache")
         cache_size = len(self._cache)
         self._cache.clear()
+        self._tinted.clear()
         logger.debug(f"Cleared {cache_size} items from cache")
\ No newline at end of file
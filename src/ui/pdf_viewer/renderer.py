@@ -27,15 +27,10 @@ class PDFRenderer:
     def render_page(self, page_number: int, zoom_level: float) -> Optional[QPixmap]:
         """Render a PDF page at the given zoom level"""
         try:
-            page = self.pdf_handler.get_page(page_number)
-            if not page:
+            # Render page to pixmap (cached by the handler)
+            pix = self.pdf_handler.get_rendered_pixmap(page_number, zoom_level)
+            if not pix:
                 return None
-                
-            # Calculate zoom matrix
-            zoom_matrix = fitz.Matrix(zoom_level, zoom_level)
-            
-            # Render page to pixmap
-            pix = page.get_pixmap(matrix=zoom_matrix, alpha=True)
 
             # Convert to QImage then QPixmap
             qimage = QImage(
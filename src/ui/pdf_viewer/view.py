@@ -58,9 +58,8 @@ class PDFView(QScrollArea):
     def _on_annotation_removed(self, annotation_id: int) -> None:
         """Handle annotation removed signal"""
         try:
-            annotations = self.viewport_widget.annotation_manager.annotations
-            if 0 <= annotation_id < len(annotations):
-                annotation = annotations[annotation_id]
+            annotation = self.viewport_widget.annotation_manager.get_annotation_by_id(annotation_id)
+            if annotation:
                 self.viewport_widget.annotation_manager.remove_annotation(annotation)
                 self.viewport_widget.update()
         except Exception as e:
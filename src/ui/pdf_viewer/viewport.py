@@ -9,8 +9,10 @@ from PyQt6.QtCore import Qt, QPointF, QRectF, QByteArray
 from typing import Optional
 import logging
 import json
+import struct
 
 from core.pdf_handler import PDFHandler, Annotation
+from config.constants import SIGNATURE_DRAG_METADATA_FORMAT
 from .annotation_manager import AnnotationManager
 from .image_cache import ImageCache
 from .renderer import PDFRenderer
@@ -296,7 +298,7 @@ class PDFViewport(QWidget):
 
     def update_page_display(self) -> None:
         """Update the page display with current zoom"""
-        if not self.pdf_handler.document:
+        if self.pdf_handler.document is None:
             return
             
         try:
@@ -317,7 +319,7 @@ class PDFViewport(QWidget):
 
         # Handle stamp and signature drops
         if mime_data.hasFormat("application/x-stamp") or mime_data.hasFormat("application/x-signature"):
-            if self.pdf_handler.document:
+            if self.pdf_handler.document is not None:
                 event.acceptProposedAction()
                 return
             else:
@@ -333,7 +335,7 @@ class PDFViewport(QWidget):
 
         # Handle stamp and signature drops
         if mime_data.hasFormat("application/x-stamp") or mime_data.hasFormat("application/x-signature"):
-            if self.pdf_handler.document:
+            if self.pdf_handler.document is not None:
                 event.acceptProposedAction()
                 return
             else:
@@ -369,7 +371,7 @@ class PDFViewport(QWidget):
     def _handle_stamp_drop(self, event: QDropEvent) -> None:
         """Handle stamp drop events"""
         try:
-            if not self.pdf_handler.document:
+            if self.pdf_handler.document is None:
                 event.ignore()
                 return
 
@@ -447,7 +449,7 @@ class PDFViewport(QWidget):
     def _handle_signature_drop(self, event: QDropEvent) -> None:
         """Handle signature drop events"""
         try:
-            if not self.pdf_handler.document:
+            if self.pdf_handler.document is None:
                 event.ignore()
                 return
 
@@ -464,10 +466,9 @@ class PDFViewport(QWidget):
 
             # Parse metadata or get from image
             if metadata_data:
-                metadata = json.loads(bytes(metadata_data.data()).decode('utf-8'))
-                aspect_ratio = metadata.get('aspect_ratio', 1.0)
-                original_width = metadata.get('original_width', 100)
-                original_height = metadata.get('original_height', 100)
+                aspect_ratio, original_width, original_height = struct.unpack(
+                    SIGNATURE_DRAG_METADATA_FORMAT, bytes(metadata_data.data())
+                )
             else:
                 # Fallback: get dimensions from image data
                 img = QImage.fromData(sig_bytes)
@@ -560,9 +561,8 @@ class PDFViewport(QWidget):
     def _remove_annotation(self, annotation: Annotation) -> None:
         """Remove an annotation"""
         try:
-            index = self.annotation_manager.annotations.index(annotation)
-            if self.pdf_handler.remove_annotation(index):
-                self.annotation_manager.remove_annotation(annotation)
+            # The view drops it from the annotation manager via annotation_removed
+            if self.pdf_handler.remove_annotation(annotation.id):
                 self.update()
                 
         except Exception as e:
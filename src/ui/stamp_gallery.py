@@ -5,9 +5,49 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QPixmap, QDrag, QImage, QColor
 from PyQt6.QtCore import Qt, QMimeData, QSize, QByteArray, QPoint
+from typing import Optional
 from core.stamp_manager import StampManager
+from config.constants import GALLERY_WIDTH
 from .flow_layout import FlowLayout
 import json
+import sys
+from functools import lru_cache
+
+# Selection is driven by the "selected" dynamic property so toggling it never re-parses the sheet
+STAMP_THUMBNAIL_STYLE = sys.intern("""
+    QLabel {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 8px;
+        margin: 4px;
+    }
+    QLabel:hover {
+        border-color: #0078d4;
+        background-color: #f0f9ff;
+        border-width: 2px;
+        padding: 7px;
+    }
+    QLabel[selected="true"] {
+        background-color: #e3f2fd;
+        border: 2px solid #0078d4;
+        padding: 7px;
+    }
+""")
+
+@lru_cache(maxsize=None)
+def color_button_style(color: str) -> str:
+    """Stylesheet for a stamp's color button, built once per color and shared"""
+    return sys.intern(f"""
+        QPushButton {{
+            background-color: {color};
+            border: 1px solid #ddd;
+            border-radius: 3px;
+        }}
+        QPushButton:hover {{
+            border: 1px solid #0078d4;
+        }}
+    """)
 
 class StampThumbnail(QLabel):
     def __init__(self, stamp_id: str, stamp_data: bytes, name: str, metadata: dict, gallery=None, parent=None):
@@ -35,21 +75,8 @@ class StampThumbnail(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setToolTip(name)
         self.setFixedSize(QSize(100, 100))
-        self.setStyleSheet("""
-            QLabel {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px;
-                margin: 4px;
-            }
-            QLabel:hover {
-                border-color: #0078d4;
-                background-color: #f0f9ff;
-                border-width: 2px;
-                padding: 7px;
-            }
-        """)
+        self.setProperty("selected", False)
+        self.setStyleSheet(STAMP_THUMBNAIL_STYLE)
         
         # Add name label
         self.name_label = QLabel(name, self)
@@ -69,16 +96,7 @@ class StampThumbnail(QLabel):
         # Add color button
         self.color_button = QPushButton(self)
         self.color_button.setFixedSize(20, 20)
-        self.color_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {metadata.get('color', '#000000')};
-                border: 1px solid #ddd;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                border: 1px solid #0078d4;
-            }}
-        """)
+        self.color_button.setStyleSheet(color_button_style(metadata.get('color', '#000000')))
         self.color_button.clicked.connect(self.show_color_picker)
         
         # Position labels and button
@@ -95,46 +113,17 @@ class StampThumbnail(QLabel):
             if self.gallery and self.gallery.stamp_manager:
                 if self.gallery.stamp_manager.update_stamp_color(self.stamp_id, new_color):
                     self.metadata['color'] = new_color
-                    self.color_button.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: {new_color};
-                            border: 1px solid #ddd;
-                            border-radius: 3px;
-                        }}
-                        QPushButton:hover {{
-                            border: 1px solid #0078d4;
-                        }}
-                    """)
+                    self.color_button.setStyleSheet(color_button_style(new_color))
 
     def set_selected(self, selected: bool):
         """Update the visual state of the stamp thumbnail"""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
-        if selected:
-            self.setStyleSheet("""
-                QLabel {
-                    background-color: #e3f2fd;
-                    border: 2px solid #0078d4;
-                    border-radius: 4px;
-                    padding: 7px;
-                    margin: 4px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QLabel {
-                    background-color: white;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    padding: 8px;
-                    margin: 4px;
-                }
-                QLabel:hover {
-                    border-color: #0078d4;
-                    background-color: #f0f9ff;
-                    border-width: 2px;
-                    padding: 7px;
-                }
-            """)
+        # Both states live in one stylesheet; re-polish to pick up the property
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def mousePressEvent(self, event):
         """Handle mouse press for selection and drag"""
@@ -183,17 +172,17 @@ class StampThumbnail(QLabel):
         drag.exec(Qt.DropAction.CopyAction | Qt.DropAction.MoveAction)
 
 class StampGallery(QWidget):
-    def __init__(self, storage_path: str):
+    def __init__(self, storage_path: str, stamp_manager: Optional[StampManager] = None):
         super().__init__()
-        self.stamp_manager = StampManager(storage_path)
+        if stamp_manager is None:
+            stamp_manager = StampManager(storage_path)
+        self.stamp_manager = stamp_manager
         self.selected_stamp = None
         self.init_ui()
         
-        # Connect stamp manager signals
-        self.stamp_manager.stamp_added.connect(self.on_stamp_added)
-        self.stamp_manager.stamp_removed.connect(self.on_stamp_removed)
-        self.stamp_manager.stamp_renamed.connect(self.on_stamp_renamed)
-        self.stamp_manager.stamp_color_changed.connect(self.on_stamp_color_changed)
+        # Connect stamp manager signals; stamp edits refresh the grid once per
+        # metadata flush instead of once per change
+        self.stamp_manager.changed.connect(self.on_stamps_changed)
         self.stamp_manager.category_added.connect(self.on_category_added)
         self.stamp_manager.category_removed.connect(self.on_category_removed)
         
@@ -374,7 +363,7 @@ class StampGallery(QWidget):
         layout.addWidget(scroll, 1)
         
         # Set fixed width for gallery
-        self.setFixedWidth(300)
+        self.setFixedWidth(GALLERY_WIDTH)
         
         # Load initial stamps
         self.load_stamps(self.category_combo.currentText())
@@ -512,12 +501,16 @@ class StampGallery(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             if self.stamp_manager.delete_stamp(self.selected_stamp.stamp_id):
+                # The grid is rebuilt on the next metadata flush; take the thumbnail
+                # out now so the deleted stamp can't be clicked or dragged meanwhile
+                thumbnail = self.selected_stamp
+                self.flow_layout.removeWidget(thumbnail)
+                thumbnail.deleteLater()
+                
                 # Clear selection
                 self.selected_stamp = None
                 self.delete_btn.setEnabled(False)
                 self.rename_btn.setEnabled(False)
-                # Reload stamps
-                self.load_stamps(self.category_combo.currentText())
             else:
                 QMessageBox.critical(
                     self,
@@ -551,17 +544,8 @@ class StampGallery(QWidget):
                 )
 
     # Signal handlers
-    def on_stamp_added(self, stamp_id: str, category: str):
-        """Handle stamp added signal"""
-        if category == self.category_combo.currentText():
-            self.load_stamps(category)
-
-    def on_stamp_removed(self, stamp_id: str):
-        """Handle stamp removed signal"""
-        self.load_stamps(self.category_combo.currentText())
-
-    def on_stamp_renamed(self, stamp_id: str, new_name: str):
-        """Handle stamp renamed signal"""
+    def on_stamps_changed(self):
+        """Handle stamp manager changes (added, removed, renamed or recolored stamps)"""
         self.load_stamps(self.category_combo.currentText())
 
     def on_category_added(self, category: str):
@@ -575,10 +559,6 @@ class StampGallery(QWidget):
             self.category_combo.removeItem(index)
             self.category_combo.setCurrentText("General")
             
-    def on_stamp_color_changed(self, stamp_id: str, new_color: str):
-        """Handle stamp color changed signal"""
-        self.load_stamps(self.category_combo.currentText())
-        
     def clear_image_cache(self, stamp_id: str, new_color: str):
         """Clear the image cache when a stamp's color changes"""
         try:
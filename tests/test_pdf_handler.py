@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PyQt6.QtCore")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.pdf_handler import PDFHandler, Annotation
+
+
+@pytest.fixture
+def handler(tmp_path):
+    path = tmp_path / "blank.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(str(path))
+    doc.close()
+
+    handler = PDFHandler()
+    assert handler.open_document(str(path))
+    yield handler
+    handler.close_document()
+
+
+def test_redo_after_undo_keeps_edits_made_after_add(handler):
+    annotation = Annotation(
+        type="stamp",
+        rect=(10, 10, 60, 60),
+        content={"image_data": b"stamp", "color": "#000000"},
+        page=0
+    )
+    assert handler.add_annotation(annotation)
+
+    # Moves and color changes edit the live annotation in place
+    annotation.rect = (100, 120, 150, 170)
+    annotation.content["color"] = "#FF0000"
+
+    assert handler.undo()
+    assert handler.annotations == []
+
+    assert handler.redo()
+    [restored] = handler.annotations
+    assert restored.id == annotation.id
+    assert restored.rect == (100, 120, 150, 170)
+    assert restored.content["color"] == "#FF0000"
+    assert restored.content["image_data"] == b"stamp"